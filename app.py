@@ -11,19 +11,43 @@ This application allows users to:
 - Export cleaned data and quality reports
 """
 
+import importlib
+
 import streamlit as st
 
-from src.constants import APP_NAME, APP_VERSION, APP_TAGLINE, UI_STEPS
-from src.session import initialize_session_state, get_current_step, set_current_step, consume_step_change
-from src.ui.components import progress_indicator, scroll_to_top_after_render
-from src.ui.theme import get_custom_css
+from src.constants import APP_NAME, APP_VERSION, UI_STEPS
+from src.session import (
+    initialize_session_state,
+    get_current_step,
+    set_current_step,
+    reset_session_state,
+    peek_step_change,
+    consume_step_change,
+)
+from src.ui.components import progress_indicator, scroll_to_top_after_render, sidebar_step_html
+from src.ui.theme import HEADER_HTML, SIDEBAR_BRANDING_HTML, get_custom_css
 from src.ui.about import render_about_page
 from src.ui.privacy import render_privacy_page
-from src.ui.step_upload import render_step_upload
-from src.ui.step_contract import render_step_contract
-from src.ui.step_cleaning import render_step_cleaning
-from src.ui.step_results import render_step_results
-from src.ui.step_export import render_step_export
+
+# Step number -> (module, renderer) for the 5-step workflow.
+# Step modules are imported lazily so only the active step's stack is loaded.
+_STEP_RENDERERS = {
+    1: ("src.ui.step_upload", "render_step_upload"),
+    2: ("src.ui.step_contract", "render_step_contract"),
+    3: ("src.ui.step_cleaning", "render_step_cleaning"),
+    4: ("src.ui.step_results", "render_step_results"),
+    5: ("src.ui.step_export", "render_step_export"),
+}
+
+# Static sidebar footer: divider, feature request link, divider, privacy note
+_SIDEBAR_FOOTER_HTML = (
+    '<hr>'
+    '<a href="https://github.com/brittanyvl/DataDoctor/issues" target="_blank" '
+    'style="color: #2F855A;">Request a Feature</a>'
+    '<hr>'
+    '<p style="font-size: 0.875rem; color: rgba(49, 51, 63, 0.6); margin: 0 0 1rem 0;">'
+    'Your data is processed in memory only and never stored.</p>'
+)
 
 
 def main():
@@ -42,46 +66,43 @@ def main():
     # Initialize session state
     initialize_session_state()
 
-    # Render sidebar
-    _render_sidebar()
-
     # Get current step
     current_step = get_current_step()
 
-    # Check for privacy page
-    if st.session_state.get("show_privacy_page", False):
-        render_privacy_page()
-        return
+    def render_workflow():
+        _render_workflow(current_step)
+
+    # Workflow, About and Privacy are separate routes; only the active one runs
+    pages = {
+        "workflow": st.Page(render_workflow, title=APP_NAME, default=True),
+        "about": st.Page(render_about_page, title="About", url_path="about"),
+        "privacy": st.Page(render_privacy_page, title="Privacy Policy", url_path="privacy"),
+    }
+    active_page = st.navigation(list(pages.values()), position="hidden")
+
+    # Render sidebar
+    _render_sidebar(current_step, pages, active_page.url_path)
+
+    active_page.run()
+
 
-    # Check for about page
-    if st.session_state.get("show_about_page", False):
-        render_about_page()
-        return
+def _render_workflow(current_step: int):
+    """
+    Render the main 5-step workflow page.
 
+    Args:
+        current_step: Current workflow step
+    """
     # Render page header with branding (green title, coal tagline)
-    # Using inline styles to guarantee they override Streamlit defaults
-    st.markdown(
-        f'<h1 style="color: #2F855A; font-size: 2.25rem; font-weight: 700; '
-        f'margin: 0 0 0.25rem 0; padding: 0; line-height: 1.1;">Data Doctor</h1>'
-        f'<p style="color: #2D3748; font-size: 1rem; font-style: italic; '
-        f'margin: 0 0 1rem 0; padding: 0;">{APP_TAGLINE}</p>',
-        unsafe_allow_html=True,
-    )
+    st.html(HEADER_HTML)
 
     # Render progress indicator
-    progress_indicator(current_step, total_steps=5)
+    progress_indicator(current_step, total_steps=len(UI_STEPS))
 
     # Render current step (5-step workflow)
-    if current_step == 1:
-        render_step_upload()
-    elif current_step == 2:
-        render_step_contract()
-    elif current_step == 3:
-        render_step_cleaning()
-    elif current_step == 4:
-        render_step_results()
-    elif current_step == 5:
-        render_step_export()
+    renderer = _get_step_renderer(current_step)
+    if renderer is not None:
+        renderer()
     else:
         st.error(f"Unknown step: {current_step}")
         set_current_step(1)
@@ -89,130 +110,126 @@ def main():
 
     # Scroll to top AFTER all content has rendered, but only when step changed
     # This is placed at the END so it executes after Streamlit finishes rendering
-    if consume_step_change():
+    if peek_step_change():
         scroll_to_top_after_render()
+        consume_step_change()
+
+
+def _get_step_renderer(step: int):
+    """
+    Resolve the render function for a workflow step, importing it on demand.
+
+    Args:
+        step: Step number (1-5)
+
+    Returns:
+        The step's render function, or None for an unknown step
+    """
+    target = _STEP_RENDERERS.get(step)
+    if target is None:
+        return None
+    module_name, func_name = target
+    return getattr(importlib.import_module(module_name), func_name)
 
 
-def _render_sidebar():
-    """Render the application sidebar."""
-    # Number emojis for steps
-    STEP_NUMBERS = ["1️⃣", "2️⃣", "3️⃣", "4️⃣", "5️⃣"]
+def _render_sidebar(current_step: int, pages: dict, active_path: str):
+    """
+    Render the application sidebar.
 
+    Args:
+        current_step: Current workflow step, read once per rerun by main()
+        pages: Navigation pages keyed by "workflow", "about" and "privacy"
+        active_path: URL path of the page being shown
+    """
     with st.sidebar:
-        # Branding header (green title, coal tagline) - compact with inline styles
-        # Using div wrapper to ensure styles apply
-        st.markdown(
-            f'<div style="margin-bottom: 0.75rem;">'
-            f'<span style="color: #2F855A; font-size: 1.25rem; font-weight: 700; '
-            f'display: block; line-height: 1.2;">{APP_NAME}</span>'
-            f'<span style="color: #2D3748; font-size: 0.8rem; font-style: italic; '
-            f'display: block; margin-top: 0.15rem;">{APP_TAGLINE}</span>'
-            f'</div>',
-            unsafe_allow_html=True,
+        _render_sidebar_content(current_step, pages, active_path)
+
+
+@st.fragment
+def _render_sidebar_content(current_step: int, pages: dict, active_path: str):
+    """
+    Render the sidebar contents as a fragment.
+
+    Sidebar interactions rerun only this fragment; buttons that change the
+    main pane (including the current step or page) escalate to a full app
+    rerun via st.rerun() or st.switch_page().
+
+    Args:
+        current_step: Current workflow step
+        pages: Navigation pages keyed by "workflow", "about" and "privacy"
+        active_path: URL path of the page being shown
+    """
+    # Branding header (green title, coal tagline) - compact with inline styles
+    st.html(SIDEBAR_BRANDING_HTML)
+
+    # Show DEMO MODE badge if in demo mode
+    if st.session_state.get("is_demo_mode"):
+        st.html(
+            '<div style="background-color: #F59E0B; color: white; '
+            'padding: 4px 12px; border-radius: 4px; font-size: 0.75rem; '
+            'font-weight: 600; text-align: center; margin-bottom: 0.5rem;">'
+            'DEMO MODE</div>'
         )
 
-        # Show DEMO MODE badge if in demo mode
-        if st.session_state.get("is_demo_mode"):
-            st.markdown(
-                '<div style="background-color: #F59E0B; color: white; '
-                'padding: 4px 12px; border-radius: 4px; font-size: 0.75rem; '
-                'font-weight: 600; text-align: center; margin-bottom: 0.5rem;">'
-                'DEMO MODE</div>',
-                unsafe_allow_html=True,
-            )
+    # Home button - returns to Step 1
+    if st.button("🏠 Home", use_container_width=True, help="Return to Step 1"):
+        set_current_step(1)
+        st.switch_page(pages["workflow"])
 
-        # Home button - returns to Step 1
-        if st.button("🏠 Home", use_container_width=True, help="Return to Step 1"):
-            st.session_state["show_privacy_page"] = False
-            st.session_state["show_about_page"] = False
-            set_current_step(1)
-            st.rerun()
-
-        # About button
-        if st.button("ℹ️ About", use_container_width=True, help="About this project"):
-            st.session_state["show_about_page"] = True
-            st.session_state["show_privacy_page"] = False
-            st.rerun()
-
-        # Clear Session button
-        if st.button("🗑️ Clear Session", use_container_width=True, help="Clear all data and start fresh"):
-            from src.session import reset_session_state
-            reset_session_state()
-            st.balloons()
-            st.rerun()
-
-        # Compact divider with less top margin
-        st.markdown('<hr style="margin: 0.25rem 0 0.5rem 0;">', unsafe_allow_html=True)
-
-        # Step navigation with number emojis
-        st.markdown("### Workflow")
-
-        current_step = get_current_step()
-
-        for step in UI_STEPS:
-            step_num = step["number"]
-            step_name = step["name"]
-            step_emoji = STEP_NUMBERS[step_num - 1] if step_num <= len(STEP_NUMBERS) else str(step_num)
-
-            # Determine if step is accessible
-            is_current = step_num == current_step
-            is_completed = step_num < current_step
-
-            if is_current:
-                # Current step - highlighted with green accent
-                st.markdown(
-                    f'<div style="background-color: #C6F6D5; padding: 8px 12px; '
-                    f'border-radius: 6px; border-left: 4px solid #2F855A; margin: 4px 0;">'
-                    f'<span style="font-weight: 600; color: #22543D;">'
-                    f'{step_emoji} {step_name}</span></div>',
-                    unsafe_allow_html=True,
-                )
-            elif is_completed:
-                # Completed step - clickable with checkmark
-                if st.button(
-                    f"✓ {step_emoji} {step_name}",
-                    key=f"nav_step_{step_num}",
-                    use_container_width=True,
-                ):
-                    set_current_step(step_num)
-                    st.rerun()
-            else:
-                # Future step - muted
-                st.markdown(
-                    f'<div style="padding: 8px 12px; color: #A0AEC0; margin: 4px 0;">'
-                    f'{step_emoji} {step_name}</div>',
-                    unsafe_allow_html=True,
-                )
-
-        st.markdown("---")
-
-        # Quick status
-        _render_status_summary()
-
-        st.markdown("---")
-
-        # Feature requests link
-        st.markdown(
-            '<a href="https://github.com/brittanyvl/DataDoctor/issues" target="_blank" '
-            'style="color: #2F855A;">Request a Feature</a>',
-            unsafe_allow_html=True,
-        )
+    # About button
+    if st.button("ℹ️ About", use_container_width=True, help="About this project"):
+        st.switch_page(pages["about"])
 
-        # Privacy section at the bottom
-        st.markdown("---")
-        st.caption(
-            "Your data is processed in memory only and never stored."
-        )
+    # Clear Session button
+    if st.button("🗑️ Clear Session", use_container_width=True, help="Clear all data and start fresh"):
+        reset_session_state()
+        st.rerun()
 
-        # Privacy policy button
-        if st.session_state.get("show_privacy_page"):
-            if st.button("← Back to App", use_container_width=True, type="primary"):
-                st.session_state["show_privacy_page"] = False
+    # Compact divider with less top margin
+    st.html('<hr style="margin: 0.25rem 0 0.5rem 0;">')
+
+    # Step navigation with number emojis
+    st.markdown("### Workflow")
+
+    # Completed steps come first and are clickable buttons; the current and
+    # future rows are static and emitted together as one HTML element
+    static_rows = []
+    for step_num, step_name, step_emoji, _ in UI_STEPS:
+        if step_num < current_step:
+            # Completed step - clickable with checkmark
+            if st.button(
+                f"✓ {step_emoji} {step_name}",
+                key=f"nav_step_{step_num}",
+                use_container_width=True,
+            ):
+                set_current_step(step_num)
                 st.rerun()
+        elif step_num == current_step:
+            # Current step - highlighted with green accent
+            static_rows.append(sidebar_step_html(step_emoji, step_name, "current"))
         else:
-            if st.button("Privacy Policy", use_container_width=True):
-                st.session_state["show_privacy_page"] = True
-                st.rerun()
+            # Future step - muted
+            static_rows.append(sidebar_step_html(step_emoji, step_name, "future"))
+
+    if static_rows:
+        st.html("".join(static_rows))
+
+    st.markdown("---")
+
+    # Quick status
+    _render_status_summary()
+
+    # Feature request link and privacy note, emitted as a single block.
+    # Stays on st.markdown because st.html's sanitizer drops target="_blank".
+    st.markdown(_SIDEBAR_FOOTER_HTML, unsafe_allow_html=True)
+
+    # Privacy policy button
+    if active_path == pages["privacy"].url_path:
+        if st.button("← Back to App", use_container_width=True, type="primary"):
+            st.switch_page(pages["workflow"])
+    else:
+        if st.button("Privacy Policy", use_container_width=True):
+            st.switch_page(pages["privacy"])
 
 
 def _render_status_summary():
@@ -222,12 +239,24 @@ def _render_status_summary():
     # File status
     df = st.session_state.get("dataframe")
     if df is not None:
-        filename = st.session_state.get("uploaded_file_name", "Unknown")
-        # Truncate long filenames
-        display_name = filename[:20] + "..." if len(filename) > 20 else filename
-        st.markdown(f"**File:** {display_name}")
-        st.markdown(f"**Rows:** {len(df):,}")
-        st.markdown(f"**Columns:** {len(df.columns)}")
+        # Status lines are formatted once per loaded DataFrame so the
+        # sidebar doesn't re-inspect or re-format it on every rerun
+        summary = st.session_state.get("_df_summary")
+        if summary is None or summary[0] is not df:
+            filename = st.session_state.get("uploaded_file_name", "Unknown")
+            # Truncate long filenames
+            display_name = filename[:20] + "..." if len(filename) > 20 else filename
+            summary = (
+                df,
+                f"**File:** {display_name}",
+                f"**Rows:** {len(df):,}",
+                f"**Columns:** {len(df.columns)}",
+            )
+            st.session_state["_df_summary"] = summary
+        _, file_line, rows_line, columns_line = summary
+        st.markdown(file_line)
+        st.markdown(rows_line)
+        st.markdown(columns_line)
     else:
         st.markdown("*No file loaded*")
 
@@ -7,15 +7,26 @@ to demonstrate Data Doctor's validation capabilities.
 
 import csv
 import random
-from datetime import datetime, timedelta
-import os
+from pathlib import Path
 
-# Seed for reproducibility
+import numpy as np
+
+# Seed for reproducibility. Per-row fields are pre-drawn in bulk from the
+# NumPy generator; the stdlib RNG covers the occasional error injection.
 random.seed(42)
+RNG = np.random.default_rng(42)
 
 # Configuration
 NUM_ROWS = 500
-OUTPUT_PATH = os.path.join(os.path.dirname(__file__), "..", "assets", "demo_data.csv")
+DATE_EPOCH = np.datetime64("2024-01-01")
+OUTPUT_PATH = Path(__file__).resolve().parent.parent / "assets" / "demo_data.csv"
+
+# Output columns, in CSV order
+FIELDNAMES = [
+    "order_id", "customer_name", "email", "phone", "quantity",
+    "unit_price", "discount_pct", "order_date", "ship_date",
+    "is_priority", "status", "state_code",
+]
 
 # Sample data pools
 FIRST_NAMES = [
@@ -49,29 +60,56 @@ INVALID_STATUSES = ["canceled", "complete", "done", "waiting", "unknown"]  # "ca
 
 INVALID_STATES = ["XX", "ZZ", "UK", "EU", "00", "ABC"]
 
+INVALID_EMAILS = (
+    "notanemail",
+    "missing@domain",
+    "@nodomain.com",
+    "spaces in@email.com",
+    "double@@at.com",
+    "no.atsign.com",
+    "",
+)
+
+INVALID_PHONES = (
+    "123",
+    "not-a-phone",
+    "123-456",
+    "12345678901234",
+    "(000) 000-0000",
+    "abc-def-ghij",
+)
+
+INVALID_DATE_FORMATS = (
+    "01/15/2024",  # MM/DD/YYYY instead of YYYY-MM-DD
+    "15-01-2024",  # DD-MM-YYYY
+    "2024/01/15",  # Wrong separator
+    "Jan 15, 2024",
+    "not-a-date",
+)
+
+INCONSISTENT_BOOLEANS = ("true", "false", "True", "False", "yes", "no", "1", "0")
+
+# Name whitespace padding: none, leading, trailing, both
+_WS_PREFIX = ("", "  ", "", "  ")
+_WS_SUFFIX = ("", "", "  ", "  ")
+
 
 def generate_valid_email(first_name, last_name):
     """Generate a valid email address."""
-    formats = [
-        f"{first_name.lower()}.{last_name.lower()}@{random.choice(EMAIL_DOMAINS)}",
-        f"{first_name.lower()}{random.randint(1, 99)}@{random.choice(EMAIL_DOMAINS)}",
-        f"{first_name[0].lower()}{last_name.lower()}@{random.choice(EMAIL_DOMAINS)}",
-    ]
-    return random.choice(formats)
+    # Pick the format first so only the values it needs are drawn
+    fmt = random.randint(0, 2)
+    domain = random.choice(EMAIL_DOMAINS)
+    if fmt == 0:
+        return f"{first_name.lower()}.{last_name.lower()}@{domain}"
+    elif fmt == 1:
+        return f"{first_name.lower()}{random.randint(1, 99)}@{domain}"
+    else:
+        return f"{first_name[0].lower()}{last_name.lower()}@{domain}"
 
 
 def generate_invalid_email():
     """Generate an invalid email address."""
-    invalid_formats = [
-        "notanemail",
-        "missing@domain",
-        "@nodomain.com",
-        "spaces in@email.com",
-        "double@@at.com",
-        "no.at" + "sign.com",
-        "",
-    ]
-    return random.choice(invalid_formats)
+    return random.choice(INVALID_EMAILS)
 
 
 def generate_valid_phone():
@@ -80,114 +118,106 @@ def generate_valid_phone():
     exchange = random.randint(200, 999)
     subscriber = random.randint(1000, 9999)
 
-    formats = [
-        f"({area_code}) {exchange}-{subscriber}",
-        f"{area_code}-{exchange}-{subscriber}",
-        f"+1 {area_code}-{exchange}-{subscriber}",
-        f"{area_code}{exchange}{subscriber}",
-    ]
-    return random.choice(formats)
+    # Only the chosen format is built
+    fmt = random.randint(0, 3)
+    if fmt == 0:
+        return f"({area_code}) {exchange}-{subscriber}"
+    elif fmt == 1:
+        return f"{area_code}-{exchange}-{subscriber}"
+    elif fmt == 2:
+        return f"+1 {area_code}-{exchange}-{subscriber}"
+    else:
+        return f"{area_code}{exchange}{subscriber}"
 
 
 def generate_invalid_phone():
     """Generate an invalid phone number."""
-    invalid_formats = [
-        "123",
-        "not-a-phone",
-        "123-456",
-        "12345678901234",
-        "(000) 000-0000",
-        "abc-def-ghij",
-    ]
-    return random.choice(invalid_formats)
+    return random.choice(INVALID_PHONES)
 
 
-def generate_date_pair():
-    """Generate order_date and ship_date pair.
+def generate_date_pairs(num_rows):
+    """Generate order_date/ship_date string pairs for every row in bulk.
 
-    Returns tuple (order_date, ship_date, is_valid).
-    Most pairs are valid (ship_date >= order_date), some are invalid.
+    Returns a dict of lists: valid pairs (ship_date 1-14 days after an
+    order in 2024) and invalid pairs (ship_date 1-10 days before the order).
     """
-    # Random order date in 2024
-    start_date = datetime(2024, 1, 1)
-    order_date = start_date + timedelta(days=random.randint(0, 364))
-
-    # Ship date is usually 1-14 days after order
-    ship_offset = random.randint(1, 14)
-    ship_date = order_date + timedelta(days=ship_offset)
-
-    return (
-        order_date.strftime("%Y-%m-%d"),
-        ship_date.strftime("%Y-%m-%d"),
-        True
-    )
+    # Valid: random order date in 2024, shipped 1-14 days later
+    order_days = RNG.integers(0, 365, num_rows)
+    ship_days = order_days + RNG.integers(1, 15, num_rows)
 
+    # Invalid: ship date BEFORE order date
+    bad_order_days = RNG.integers(30, 365, num_rows)
+    bad_ship_days = bad_order_days - RNG.integers(1, 11, num_rows)
 
-def generate_invalid_date_pair():
-    """Generate an invalid date pair where ship_date < order_date."""
-    start_date = datetime(2024, 1, 1)
-    order_date = start_date + timedelta(days=random.randint(30, 364))
+    return {
+        "order_date": _format_days(order_days),
+        "ship_date": _format_days(ship_days),
+        "invalid_order_date": _format_days(bad_order_days),
+        "invalid_ship_date": _format_days(bad_ship_days),
+    }
 
-    # Ship date BEFORE order date (invalid)
-    ship_offset = random.randint(1, 10)
-    ship_date = order_date - timedelta(days=ship_offset)
 
-    return (
-        order_date.strftime("%Y-%m-%d"),
-        ship_date.strftime("%Y-%m-%d"),
-        False
-    )
+def _format_days(days):
+    """Format day offsets from 2024-01-01 as YYYY-MM-DD strings."""
+    dates = DATE_EPOCH + days.astype("timedelta64[D]")
+    return np.datetime_as_string(dates, unit="D").tolist()
 
 
 def generate_invalid_date_format():
     """Generate date in wrong format."""
-    invalid_formats = [
-        "01/15/2024",  # MM/DD/YYYY instead of YYYY-MM-DD
-        "15-01-2024",  # DD-MM-YYYY
-        "2024/01/15",  # Wrong separator
-        "Jan 15, 2024",
-        "not-a-date",
-    ]
-    return random.choice(invalid_formats)
-
-
-def generate_boolean():
-    """Generate boolean value in Y/N format."""
-    return random.choice(["Y", "N"])
+    return random.choice(INVALID_DATE_FORMATS)
 
 
 def generate_inconsistent_boolean():
     """Generate boolean in inconsistent format."""
-    formats = ["true", "false", "True", "False", "yes", "no", "1", "0"]
-    return random.choice(formats)
+    return random.choice(INCONSISTENT_BOOLEANS)
 
 
-def generate_row(row_id, inject_errors=False, error_types=None):
-    """Generate a single row of data."""
-    first_name = random.choice(FIRST_NAMES)
-    last_name = random.choice(LAST_NAMES)
+def draw_row_fields(num_rows):
+    """Pre-draw the per-row random fields for the whole dataset in bulk.
+
+    Returns a dict of equal-length lists, one entry per row.
+    """
+    return {
+        "first_name": RNG.choice(FIRST_NAMES, num_rows).tolist(),
+        "last_name": RNG.choice(LAST_NAMES, num_rows).tolist(),
+        # Add leading/trailing whitespace to ~20% of names for cleaning demo:
+        # 0 = none, otherwise an index into _WS_PREFIX/_WS_SUFFIX
+        "whitespace": np.where(
+            RNG.random(num_rows) < 0.2, RNG.integers(1, 4, num_rows), 0
+        ).tolist(),
+        "quantity": RNG.integers(1, 101, num_rows).tolist(),
+        "unit_price": np.round(RNG.uniform(10.0, 500.0, num_rows), 2).tolist(),
+        "discount_pct": RNG.integers(0, 31, num_rows).tolist(),
+        **generate_date_pairs(num_rows),
+        "is_priority": RNG.choice(["Y", "N"], num_rows).tolist(),
+        "status": RNG.choice(VALID_STATUSES, num_rows).tolist(),
+        "state_code": RNG.choice(US_STATES, num_rows).tolist(),
+    }
+
+
+def generate_row(row_id, fields, idx, inject_errors=False, error_types=None):
+    """Generate a single row of data from pre-drawn fields at index idx.
+
+    Returns the row as a list of values in FIELDNAMES order.
+    """
+    first_name = fields["first_name"][idx]
+    last_name = fields["last_name"][idx]
 
     # Default values (valid)
     order_id = row_id
-    # Add leading/trailing whitespace to ~20% of names for cleaning demo
-    customer_name = f"{first_name} {last_name}"
-    if random.random() < 0.2:
-        whitespace_type = random.choice(["leading", "trailing", "both"])
-        if whitespace_type == "leading":
-            customer_name = f"  {customer_name}"
-        elif whitespace_type == "trailing":
-            customer_name = f"{customer_name}  "
-        else:
-            customer_name = f"  {customer_name}  "
+    ws = fields["whitespace"][idx]
+    customer_name = f"{_WS_PREFIX[ws]}{first_name} {last_name}{_WS_SUFFIX[ws]}"
     email = generate_valid_email(first_name, last_name)
     phone = generate_valid_phone()
-    quantity = random.randint(1, 100)
-    unit_price = round(random.uniform(10.0, 500.0), 2)
-    discount_pct = f"{random.randint(0, 30)}%"
-    order_date, ship_date, _ = generate_date_pair()
-    is_priority = generate_boolean()
-    status = random.choice(VALID_STATUSES)
-    state_code = random.choice(US_STATES)
+    quantity = fields["quantity"][idx]
+    unit_price = fields["unit_price"][idx]
+    discount_pct = f"{fields['discount_pct'][idx]}%"
+    order_date = fields["order_date"][idx]
+    ship_date = fields["ship_date"][idx]
+    is_priority = fields["is_priority"][idx]
+    status = fields["status"][idx]
+    state_code = fields["state_code"][idx]
 
     # Inject specific errors
     if inject_errors and error_types:
@@ -205,7 +235,8 @@ def generate_row(row_id, inject_errors=False, error_types=None):
             elif error_type == "negative_price":
                 unit_price = round(random.uniform(-100.0, -1.0), 2)
             elif error_type == "invalid_date_order":
-                order_date, ship_date, _ = generate_invalid_date_pair()
+                order_date = fields["invalid_order_date"][idx]
+                ship_date = fields["invalid_ship_date"][idx]
             elif error_type == "invalid_date_format":
                 if random.random() > 0.5:
                     order_date = generate_invalid_date_format()
@@ -218,26 +249,16 @@ def generate_row(row_id, inject_errors=False, error_types=None):
             elif error_type == "invalid_state":
                 state_code = random.choice(INVALID_STATES)
 
-    return {
-        "order_id": order_id,
-        "customer_name": customer_name,
-        "email": email,
-        "phone": phone,
-        "quantity": quantity,
-        "unit_price": unit_price,
-        "discount_pct": discount_pct,
-        "order_date": order_date,
-        "ship_date": ship_date,
-        "is_priority": is_priority,
-        "status": status,
-        "state_code": state_code,
-    }
+    # Row values in FIELDNAMES order
+    return [
+        order_id, customer_name, email, phone, quantity,
+        unit_price, discount_pct, order_date, ship_date,
+        is_priority, status, state_code,
+    ]
 
 
 def main():
     """Generate the demo dataset."""
-    rows = []
-
     # Error injection schedule
     # We want ~150 total errors spread across different types
     error_schedule = {
@@ -261,32 +282,34 @@ def main():
         (450, 455): ["invalid_state"],
     }
 
-    for i in range(1, NUM_ROWS + 1):
-        # Check if this row should have errors
-        error_types = None
-        for (start, end), errors in error_schedule.items():
-            if start <= i <= end:
-                error_types = errors
-                break
-
-        row = generate_row(i, inject_errors=error_types is not None, error_types=error_types)
-        rows.append(row)
+    # Expand the schedule into a per-row lookup (index = row number)
+    error_types_by_row = [None] * (NUM_ROWS + 1)
+    for (start, end), errors in error_schedule.items():
+        for j in range(start, min(end, NUM_ROWS) + 1):
+            if error_types_by_row[j] is None:
+                error_types_by_row[j] = errors
+
+    fields = draw_row_fields(NUM_ROWS)
+
+    # Rows are generated lazily and streamed straight to the writer
+    rows = (
+        generate_row(
+            i, fields, i - 1,
+            inject_errors=error_types_by_row[i] is not None,
+            error_types=error_types_by_row[i],
+        )
+        for i in range(1, NUM_ROWS + 1)
+    )
 
     # Write to CSV
-    os.makedirs(os.path.dirname(OUTPUT_PATH), exist_ok=True)
-
-    fieldnames = [
-        "order_id", "customer_name", "email", "phone", "quantity",
-        "unit_price", "discount_pct", "order_date", "ship_date",
-        "is_priority", "status", "state_code"
-    ]
+    OUTPUT_PATH.parent.mkdir(parents=True, exist_ok=True)
 
-    with open(OUTPUT_PATH, "w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
+    with OUTPUT_PATH.open("w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(FIELDNAMES)
         writer.writerows(rows)
 
-    print(f"Generated {len(rows)} rows to {OUTPUT_PATH}")
+    print(f"Generated {NUM_ROWS} rows to {OUTPUT_PATH}")
 
     # Print error summary
     print("\nError Summary:")
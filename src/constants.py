@@ -5,6 +5,8 @@ This module defines all hard-coded limits, version information, and
 configuration constants used throughout the Data Doctor application.
 """
 
+from typing import NamedTuple
+
 # Application metadata
 APP_NAME = "Data Doctor"
 APP_VERSION = "0.1.0"
@@ -85,9 +87,10 @@ SEVERITY_LEVELS = ["error", "warning"]
 # Boolean recognition tokens (Section 23.6)
 BOOLEAN_TRUE_TOKENS = {"true", "yes", "1", "t", "y", "on"}
 BOOLEAN_FALSE_TOKENS = {"false", "no", "0", "f", "n", "off"}
+BOOLEAN_ALL_TOKENS = frozenset(BOOLEAN_TRUE_TOKENS | BOOLEAN_FALSE_TOKENS)
 
-# Default null tokens
-DEFAULT_NULL_TOKENS = ["", "NA", "N/A", "null", "None", "NULL", "none"]
+# Default null tokens (tuple so it can be shared without copying)
+DEFAULT_NULL_TOKENS = ("", "NA", "N/A", "null", "None", "NULL", "none")
 
 # Outlier detection defaults (Section 23.5)
 OUTLIER_IQR_MULTIPLIER_DEFAULT = 1.5
@@ -154,13 +157,22 @@ CASE_OPTIONS = ["none", "lower", "upper", "title"]
 COMPARISON_OPERATORS = ["<", "<=", ">", ">=", "==", "!="]
 
 # UI step definitions (5-step workflow)
-UI_STEPS = [
-    {"number": 1, "name": "Data Check-In", "description": "Upload dataset and configure columns"},
-    {"number": 2, "name": "Order Diagnostics", "description": "Define data quality rules"},
-    {"number": 3, "name": "Order Treatments", "description": "Configure data cleaning options"},
-    {"number": 4, "name": "Review Findings", "description": "Review diagnostic findings"},
-    {"number": 5, "name": "Download Data & Reports", "description": "Download results"},
-]
+class UIStep(NamedTuple):
+    """A workflow step as shown in the sidebar."""
+
+    number: int
+    name: str
+    emoji: str
+    description: str
+
+
+UI_STEPS = (
+    UIStep(1, "Data Check-In", "1️⃣", "Upload dataset and configure columns"),
+    UIStep(2, "Order Diagnostics", "2️⃣", "Define data quality rules"),
+    UIStep(3, "Order Treatments", "3️⃣", "Configure data cleaning options"),
+    UIStep(4, "Review Findings", "4️⃣", "Review diagnostic findings"),
+    UIStep(5, "Download Data & Reports", "5️⃣", "Download results"),
+)
 
 # Characters removed by data cleaning options
 SPECIAL_CHARS_REMOVED = "Control characters (ASCII 0-31), null bytes, backspace, form feed, vertical tab, and other non-printable characters"
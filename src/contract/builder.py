@@ -5,8 +5,9 @@ This module provides functions to build a Contract from user selections
 in the Streamlit UI.
 """
 
-from datetime import datetime
+import re
 from typing import Any, Optional
+import time
 import uuid
 
 import pandas as pd
@@ -14,6 +15,7 @@ import pandas as pd
 from src.constants import (
     APP_NAME,
     APP_VERSION,
+    BOOLEAN_ALL_TOKENS,
     CONTRACT_VERSION,
     DEFAULT_NULL_TOKENS,
     MAX_COLUMN_COUNT,
@@ -39,6 +41,14 @@ from src.contract.schema import (
     TestConfig,
 )
 
+# Compiled patterns for value-based type inference
+_INT_RE = re.compile(r"^-?\d+$")
+_INT_CLEAN_RE = re.compile(r"[,$%€£]")
+_FLOAT_CLEAN_RE = re.compile(r"[,$]")
+
+# Leading rows scanned for non-null values before falling back to the full column
+_TYPE_SCAN_ROWS = 200
+
 
 def build_contract_from_dataframe(
     df: pd.DataFrame,
@@ -62,23 +72,32 @@ def build_contract_from_dataframe(
     """
     ignored_set = set(ignored_columns or [])
 
+    # Read all dtypes in one pass; only pull a column's values when the
+    # dtype alone can't decide its type
+    row_count = len(df)
+
+    # Stringify column labels once; ignored columns are matched on these too
+    col_names_str = list(map(str, df.columns))
+
     columns = []
-    for col_name in df.columns:
+    for position, (col_name, dtype) in enumerate(zip(col_names_str, df.dtypes)):
         # Skip ignored columns - they won't be in the contract
-        if str(col_name) in ignored_set:
+        if col_name in ignored_set:
             continue
 
         # Infer data type from pandas dtype and column name
-        inferred_type = infer_data_type(df[col_name], str(col_name))
+        inferred_type = _infer_type_from_dtype(
+            dtype, col_name, row_count
+        ) or _infer_type_from_values(df.iloc[:, position], col_name)
 
         columns.append(
             ColumnConfig(
-                name=str(col_name),
+                name=col_name,
                 data_type=inferred_type,
                 required=False,
                 normalization=Normalization(
                     trim_whitespace=True,
-                    null_tokens=DEFAULT_NULL_TOKENS.copy(),
+                    null_tokens=DEFAULT_NULL_TOKENS,
                     case="none",
                     remove_non_printable=True,
                 ),
@@ -92,7 +111,7 @@ def build_contract_from_dataframe(
     return Contract(
         contract_version=CONTRACT_VERSION,
         contract_id=str(uuid.uuid4()),
-        created_at_utc=datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ"),
+        created_at_utc=time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
         app=AppInfo(name=APP_NAME, version=APP_VERSION),
         limits=Limits(
             max_upload_mb=MAX_UPLOAD_SIZE_MB,
@@ -157,94 +176,142 @@ def infer_data_type(series: pd.Series, column_name: str = "") -> str:
     Returns:
         Inferred data type string (text, boolean, integer, float, date, timestamp)
     """
+    return _infer_type_from_dtype(
+        series.dtype, column_name, len(series)
+    ) or _infer_type_from_values(series, column_name)
+
+
+def _infer_type_from_dtype(dtype: Any, column_name: str, row_count: int) -> Optional[str]:
+    """
+    Infer the data type from the pandas dtype and column name alone.
+
+    Args:
+        dtype: The column's pandas dtype
+        column_name: Column name to help infer type
+        row_count: Number of rows in the column
+
+    Returns:
+        Inferred data type, or None if the values need to be inspected
+    """
+    dtype_str = str(dtype)
+
+    # Numeric columns are never name-hinted as dates (e.g. "update_date_id")
+    if "int" in dtype_str and row_count > 0:
+        return "integer"
+    elif "float" in dtype_str:
+        # Float columns may be entirely NaN; that needs the values
+        return None
+
     # Check if column name contains "date" (case insensitive)
     # This is a strong hint that the column should be treated as a date
-    col_name_lower = column_name.lower()
-    if "date" in col_name_lower:
+    if "date" in column_name.lower():
         return "date"
 
-    # Get non-null values
-    non_null = series.dropna()
+    if "bool" in dtype_str and row_count > 0:
+        return "boolean"
+    elif "datetime" in dtype_str:
+        return None
 
-    if len(non_null) == 0:
+    # Only string columns (object or pandas string dtype) need value-based
+    # inference
+    if not pd.api.types.is_string_dtype(dtype):
         return "text"
 
-    # Check the pandas dtype first
+    return None
+
+
+def _infer_type_from_values(series: pd.Series, column_name: str) -> str:
+    """
+    Infer the data type by inspecting a column's values.
+
+    Used for object columns and for float/datetime columns, which may
+    contain no values at all.
+
+    Args:
+        series: The pandas Series to analyze
+        column_name: Column name to help infer type
+
+    Returns:
+        Inferred data type string
+    """
     dtype_str = str(series.dtype)
 
-    if "int" in dtype_str:
-        return "integer"
-    elif "float" in dtype_str:
+    if "float" in dtype_str and series.notna().any():
         return "float"
-    elif "bool" in dtype_str:
-        return "boolean"
-    elif "datetime" in dtype_str:
+
+    if "date" in column_name.lower():
+        return "date"
+
+    if "datetime" in dtype_str and series.notna().any():
         return "timestamp"
 
-    # For object dtype, try to infer from values
-    if series.dtype == object:
-        # Sample up to 20 values for type inference (per user request)
-        sample = non_null.head(20)
+    if not pd.api.types.is_string_dtype(series.dtype):
+        return "text"
 
-        # Try to detect booleans first (use 20 rows)
-        if _looks_like_boolean(sample):
-            return "boolean"
+    # For string columns, try to infer from non-null values near the top of
+    # the column; only scan the whole column if that window is all null
+    non_null = series.iloc[:_TYPE_SCAN_ROWS].dropna()
+    if len(non_null) == 0:
+        non_null = series.dropna()
 
-        # Try to detect integers
-        if _looks_like_integer(sample):
-            return "integer"
+    if len(non_null) == 0:
+        return "text"
 
-        # Try to detect floats
-        if _looks_like_float(sample):
-            return "float"
+    # Sample up to 20 values for type inference (per user request)
+    sample = non_null.head(20)
 
-        # Try to detect dates
-        if _looks_like_date(sample):
-            return "date"
+    # Stringify the sample once and share it across the text-based checks
+    sample_str = sample.astype(str)
+
+    # Try to detect booleans first (use 20 rows)
+    if _looks_like_boolean(sample_str):
+        return "boolean"
+
+    # Try to detect integers
+    if _looks_like_integer(sample_str):
+        return "integer"
+
+    # Try to detect floats
+    if _looks_like_float(sample_str):
+        return "float"
+
+    # Try to detect dates
+    if _looks_like_date(sample):
+        return "date"
 
     return "text"
 
 
 def _looks_like_boolean(series: pd.Series) -> bool:
-    """Check if series looks like boolean values."""
-    bool_tokens = {
-        "true", "false", "yes", "no", "1", "0",
-        "t", "f", "y", "n", "on", "off",
-    }
+    """Check if a stringified series looks like boolean values."""
     try:
-        values = series.astype(str).str.lower().str.strip()
+        values = series.str.lower().str.strip()
         unique_values = set(values.unique())
-        return unique_values.issubset(bool_tokens)
+        return unique_values.issubset(BOOLEAN_ALL_TOKENS)
     except Exception:
         return False
 
 
 def _looks_like_integer(series: pd.Series) -> bool:
-    """Check if series looks like integer values, including with punctuation like %, $, etc."""
+    """Check if a stringified series looks like integer values, including with punctuation like %, $, etc."""
     try:
-        # Remove common punctuation that might surround numbers: $, %, commas
-        cleaned = series.astype(str).str.replace(",", "", regex=False)
-        cleaned = cleaned.str.replace("$", "", regex=False)
-        cleaned = cleaned.str.replace("%", "", regex=False)
-        cleaned = cleaned.str.replace("€", "", regex=False)
-        cleaned = cleaned.str.replace("£", "", regex=False)
-        cleaned = cleaned.str.strip()
+        # Remove common punctuation that might surround numbers ($, %, commas)
+        # in a single regex pass
+        cleaned = series.str.replace(_INT_CLEAN_RE, "", regex=True).str.strip()
         # Check if all values are digits (possibly with leading minus)
-        pattern = r"^-?\d+$"
-        return cleaned.str.match(pattern).all()
+        return cleaned.str.match(_INT_RE).all()
     except Exception:
         return False
 
 
 def _looks_like_float(series: pd.Series) -> bool:
-    """Check if series looks like float values."""
+    """Check if a stringified series looks like float values."""
     try:
-        # Remove commas and try to convert
-        cleaned = series.astype(str).str.replace(",", "", regex=False)
-        cleaned = cleaned.str.replace("$", "", regex=False)
-        cleaned = cleaned.str.strip()
-        pd.to_numeric(cleaned)
-        return True
+        # Remove commas and dollar signs in a single pass and try to convert
+        cleaned = series.str.replace(_FLOAT_CLEAN_RE, "", regex=True).str.strip()
+        # Coerce instead of raising so plain text columns don't pay for an
+        # exception; any unparseable value shows up as NaN
+        return not pd.to_numeric(cleaned, errors="coerce").isna().any()
     except Exception:
         return False
 
@@ -252,9 +319,8 @@ def _looks_like_float(series: pd.Series) -> bool:
 def _looks_like_date(series: pd.Series) -> bool:
     """Check if series looks like date values."""
     try:
-        # Try to parse as dates
-        pd.to_datetime(series, errors="raise")
-        return True
+        # Try to parse as dates; unparseable values come back as NaT
+        return not pd.to_datetime(series, errors="coerce").isna().any()
     except Exception:
         return False
 
@@ -275,12 +341,13 @@ def update_column_config(
     Returns:
         Updated contract
     """
-    for col in contract.columns:
-        if col.name == column_name:
-            for key, value in updates.items():
-                if hasattr(col, key):
-                    setattr(col, key, value)
-            break
+    col = contract.get_column(column_name)
+    if col is not None:
+        for key, value in updates.items():
+            if hasattr(col, key):
+                setattr(col, key, value)
+        if "name" in updates:
+            contract.invalidate_column_index()
 
     return contract
 
@@ -307,21 +374,20 @@ def add_column_test(
     Returns:
         Updated contract
     """
-    for col in contract.columns:
-        if col.name == column_name:
-            test = TestConfig(
-                type=test_type,
-                severity=severity,
-                params=params or {},
+    col = contract.get_column(column_name)
+    if col is not None:
+        test = TestConfig(
+            type=test_type,
+            severity=severity,
+            params=params or {},
+        )
+        if on_fail:
+            test.on_fail = FailureHandling(
+                action=on_fail.get("action", "label_failure"),
+                label_column_name=on_fail.get("label_column_name"),
+                quarantine_export_name=on_fail.get("quarantine_export_name"),
             )
-            if on_fail:
-                test.on_fail = FailureHandling(
-                    action=on_fail.get("action", "label_failure"),
-                    label_column_name=on_fail.get("label_column_name"),
-                    quarantine_export_name=on_fail.get("quarantine_export_name"),
-                )
-            col.tests.append(test)
-            break
+        col.tests.append(test)
 
     return contract
 
@@ -344,15 +410,14 @@ def add_column_remediation(
     Returns:
         Updated contract
     """
-    for col in contract.columns:
-        if col.name == column_name:
-            col.remediation.append(
-                RemediationConfig(
-                    type=remediation_type,
-                    params=params or {},
-                )
+    col = contract.get_column(column_name)
+    if col is not None:
+        col.remediation.append(
+            RemediationConfig(
+                type=remediation_type,
+                params=params or {},
             )
-            break
+        )
 
     return contract
 
@@ -456,16 +521,15 @@ def update_export_config(
     Returns:
         Updated contract
     """
-    if report_html is not None:
-        contract.exports.report_html = report_html
-    if cleaned_dataset is not None:
-        contract.exports.cleaned_dataset = cleaned_dataset
-    if contract_yaml is not None:
-        contract.exports.contract_yaml = contract_yaml
-    if remediation_summary is not None:
-        contract.exports.remediation_summary = remediation_summary
-    if output_format is not None:
-        contract.exports.output_format = output_format
+    for attr, value in (
+        ("report_html", report_html),
+        ("cleaned_dataset", cleaned_dataset),
+        ("contract_yaml", contract_yaml),
+        ("remediation_summary", remediation_summary),
+        ("output_format", output_format),
+    ):
+        if value is not None:
+            setattr(contract.exports, attr, value)
 
     return contract
 
@@ -481,10 +545,7 @@ def get_column_config(contract: Contract, column_name: str) -> Optional[ColumnCo
     Returns:
         ColumnConfig or None if not found
     """
-    for col in contract.columns:
-        if col.name == column_name:
-            return col
-    return None
+    return contract.get_column(column_name)
 
 
 def detect_percentage_column(series: pd.Series) -> dict:
@@ -4,11 +4,71 @@ YAML contract parsing.
 This module handles loading and serializing YAML contracts.
 """
 
-from typing import Optional
+import codecs
+import copy
+import functools
+import json
+import os
+import re
+from typing import Optional, Union
 
 import yaml
 
-from src.contract.schema import Contract, contract_to_dict, dict_to_contract
+from src.contract.schema import (
+    CONTRACT_DATACLASSES,
+    Contract,
+    _new_contract_id,
+    _utc_now_iso,
+    contract_field_items,
+    contract_to_dict,
+    dict_to_contract,
+)
+
+# Prefer the libyaml-backed loader/dumper; fall back to pure Python if
+# PyYAML was built without libyaml
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+
+# First line of contracts written by serialize_contract_to_yaml(pretty=False)
+_JSON_CONTRACT_HEADER = "# Data Doctor Contract\n"
+
+# JSON string literals (left alone) or float tokens YAML 1.1 would not read
+# back as floats: exponents without a decimal point, NaN and the infinities
+_JSON_UNSAFE_FLOAT_RE = re.compile(
+    r'("(?:[^"\\]|\\.)*")|(?<![0-9.])(-?[0-9]+)(e[-+][0-9]+)|NaN|(-?)Infinity'
+)
+
+# Contract fields dict_to_contract fills in when the document omits them.
+# Cached parses record which ones were generated so each copy gets its own.
+_GENERATED_FIELDS = ("contract_id", "created_at_utc")
+
+# A memoized parse: (Contract, error_message, names of generated fields)
+_CachedParse = tuple[Optional[Contract], Optional[str], frozenset[str]]
+_NO_GENERATED_FIELDS: frozenset[str] = frozenset()
+
+# Byte-order marks the YAML loader would decode as UTF-16 (the UTF-32 LE
+# mark starts with the UTF-16 LE one). Contracts must be UTF-8.
+_NON_UTF8_BOMS = (codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE, codecs.BOM_UTF32_BE)
+
+
+class _ContractDumper(_YAML_DUMPER):
+    """Safe dumper that writes contract dataclasses directly as YAML mappings."""
+
+    def ignore_aliases(self, data):
+        # Shared defaults are written out in full, never as &id anchors
+        return True
+
+
+def _represent_contract_dataclass(dumper, obj):
+    """Represent a contract dataclass as a mapping of its serialized fields."""
+    return dumper.represent_mapping("tag:yaml.org,2002:map", contract_field_items(obj))
+
+
+for _cls in CONTRACT_DATACLASSES:
+    _ContractDumper.add_representer(_cls, _represent_contract_dataclass)
+# Tuples (e.g. shared null-token defaults) are plain YAML sequences
+_ContractDumper.add_representer(tuple, yaml.SafeDumper.represent_list)
 
 
 class ContractParseError(Exception):
@@ -28,25 +88,78 @@ def parse_yaml_contract(yaml_content: str) -> tuple[Optional[Contract], Optional
         Tuple of (Contract, error_message). If successful, error_message is None.
         If failed, Contract is None.
     """
+    return _private_copy(_parse_yaml_contract_cached(yaml_content))
+
+
+def _private_copy(result: _CachedParse) -> tuple[Optional[Contract], Optional[str]]:
+    """
+    Copy a cached parse result so callers can edit it without touching the cache.
+
+    An ID or timestamp the document didn't provide is generated afresh for
+    each copy, as an uncached parse would, instead of reusing the values
+    made for the first parse.
+    """
+    contract, error, generated_fields = result
+    if contract is not None:
+        contract = copy.deepcopy(contract)
+        if "contract_id" in generated_fields:
+            contract.contract_id = _new_contract_id()
+        if "created_at_utc" in generated_fields:
+            contract.created_at_utc = _utc_now_iso()
+    return contract, error
+
+
+@functools.lru_cache(maxsize=32)
+def _parse_yaml_contract_cached(yaml_content: Union[str, bytes]) -> _CachedParse:
+    """
+    Parse YAML text or raw file bytes into a Contract object, memoized on the content.
+
+    Streamlit reruns re-load the same uploaded contract repeatedly; identical
+    content skips YAML parsing and the dict-to-Contract conversion.
+
+    Args:
+        yaml_content: YAML content as a string, or file bytes for the
+            loader to decode itself
+
+    Returns:
+        Tuple of (Contract, error_message, generated_fields). The Contract
+        is shared and must not be mutated; generated_fields names the
+        _GENERATED_FIELDS the document left out.
+    """
+    # The loader would accept UTF-16 bytes by their byte-order mark
+    if isinstance(yaml_content, bytes) and yaml_content.startswith(_NON_UTF8_BOMS):
+        return None, "Contract file must be UTF-8 encoded.", _NO_GENERATED_FIELDS
+
     try:
         # Parse YAML
-        data = yaml.safe_load(yaml_content)
+        data = yaml.load(yaml_content, Loader=_YAML_LOADER)
 
         if data is None:
-            return None, "YAML file is empty."
+            return None, "YAML file is empty.", _NO_GENERATED_FIELDS
 
         if not isinstance(data, dict):
-            return None, "YAML root must be a mapping (dictionary)."
+            return None, "YAML root must be a mapping (dictionary).", _NO_GENERATED_FIELDS
 
         # Convert to Contract object
         contract = dict_to_contract(data)
-
-        return contract, None
-
+        generated_fields = frozenset(
+            name for name in _GENERATED_FIELDS if name not in data
+        )
+
+        return contract, None, generated_fields
+
+    except yaml.reader.ReaderError as e:
+        # libyaml doesn't say whether decoding failed; check only on this path
+        if isinstance(yaml_content, bytes):
+            try:
+                yaml_content.decode("utf-8")
+            except UnicodeDecodeError:
+                return None, "Contract file must be UTF-8 encoded.", _NO_GENERATED_FIELDS
+        return None, f"Invalid YAML syntax: {str(e)}", _NO_GENERATED_FIELDS
     except yaml.YAMLError as e:
-        return None, f"Invalid YAML syntax: {str(e)}"
+        return None, f"Invalid YAML syntax: {str(e)}", _NO_GENERATED_FIELDS
     except Exception as e:
-        return None, f"Error parsing contract: {str(e)}"
+        return None, f"Error parsing contract: {str(e)}", _NO_GENERATED_FIELDS
 
 
 def parse_yaml_file(file_content: bytes) -> tuple[Optional[Contract], Optional[str]]:
@@ -56,32 +169,87 @@ def parse_yaml_file(file_content: bytes) -> tuple[Optional[Contract], Optional[s
     Args:
         file_content: YAML file content as bytes
 
+    Returns:
+        Tuple of (Contract, error_message)
+    """
+    # The loader reads the bytes directly, skipping a separate decode pass
+    return _private_copy(_parse_yaml_contract_cached(bytes(file_content)))
+
+
+def parse_yaml_file_path(path: str) -> tuple[Optional[Contract], Optional[str]]:
+    """
+    Parse a YAML contract file on disk into a Contract object.
+
+    The parsed contract is kept in memory until the file's modification
+    time or size changes, so reloading an unchanged file skips reading and
+    parsing it again.
+
+    Args:
+        path: Path to the YAML contract file
+
     Returns:
         Tuple of (Contract, error_message)
     """
     try:
-        yaml_content = file_content.decode("utf-8")
-        return parse_yaml_contract(yaml_content)
-    except UnicodeDecodeError:
-        return None, "Contract file must be UTF-8 encoded."
+        stat = os.stat(path)
+    except OSError:
+        return None, f"Contract file not found: {path}"
+
+    return _private_copy(
+        _parse_yaml_file_path_cached(os.path.abspath(path), stat.st_mtime_ns, stat.st_size)
+    )
 
 
-def serialize_contract_to_yaml(contract: Contract) -> str:
+@functools.lru_cache(maxsize=8)
+def _parse_yaml_file_path_cached(path: str, mtime_ns: int, size: int) -> _CachedParse:
+    """
+    Read and parse a YAML contract file, memoized on its path and stat.
+
+    Args:
+        path: Absolute path to the YAML contract file
+        mtime_ns: File modification time in nanoseconds (cache key only)
+        size: File size in bytes (cache key only)
+
+    Returns:
+        Tuple of (Contract, error_message, generated_fields), as returned
+        by _parse_yaml_contract_cached
+    """
+    try:
+        with open(path, "rb") as f:
+            file_content = f.read()
+    except OSError as e:
+        return None, f"Could not read contract file: {str(e)}", _NO_GENERATED_FIELDS
+
+    return _parse_yaml_contract_cached(file_content)
+
+
+def serialize_contract_to_yaml(contract: Contract, pretty: bool = True) -> str:
     """
     Serialize a Contract object to YAML string.
 
     Args:
         contract: The Contract to serialize
+        pretty: Write block-style YAML for people to read and edit. When
+            False, write JSON (which is valid YAML) for machine re-saves;
+            it is much faster and loads back to the same contract.
 
     Returns:
         YAML string representation
     """
-    # Convert to dictionary
-    contract_dict = contract_to_dict(contract)
-
-    # Serialize to YAML with nice formatting
+    if not pretty:
+        json_content = json.dumps(
+            contract_to_dict(contract), indent=2, ensure_ascii=False
+        )
+        return (
+            _JSON_CONTRACT_HEADER
+            + _JSON_UNSAFE_FLOAT_RE.sub(_yaml_float_token, json_content)
+            + "\n"
+        )
+
+    # Serialize straight from the dataclasses, with nice formatting
     yaml_content = yaml.dump(
-        contract_dict,
+        contract,
+        Dumper=_ContractDumper,
         default_flow_style=False,
         allow_unicode=True,
         sort_keys=False,
@@ -91,6 +259,18 @@ def serialize_contract_to_yaml(contract: Contract) -> str:
     return yaml_content
 
 
+def _yaml_float_token(match: re.Match) -> str:
+    """Rewrite a JSON float token into a form YAML 1.1 reads as a float."""
+    string_literal, mantissa, exponent, sign = match.groups()
+    if string_literal is not None:
+        return string_literal
+    if mantissa is not None:
+        return f"{mantissa}.0{exponent}"  # 1e-05 -> 1.0e-05
+    if sign is not None:
+        return f"{sign}.inf"
+    return ".nan"
+
+
 def serialize_contract_to_bytes(contract: Contract) -> bytes:
     """
     Serialize a Contract object to YAML bytes (for download).
@@ -127,10 +307,12 @@ def merge_contract_with_defaults(
     # Get existing column names in contract
     existing_names = {col.name for col in contract.columns}
 
-    # Add missing columns with defaults
-    for col_name in column_names:
-        if col_name not in existing_names:
-            contract.columns.append(create_default_column_config(col_name))
+    # Add missing columns with defaults, in dataset order and without repeats
+    contract.columns.extend(
+        create_default_column_config(col_name)
+        for col_name in dict.fromkeys(column_names)
+        if col_name not in existing_names
+    )
 
     return contract
 
@@ -5,13 +5,59 @@ This module defines dataclasses representing the structure of a
 Data Doctor contract as specified in Section 21 of the acceptance criteria.
 """
 
-from dataclasses import dataclass, field
-from datetime import datetime
-from typing import Any, Optional
+from dataclasses import dataclass, field, fields
+from types import MappingProxyType
+from typing import Any, Optional, Sequence
+import os
+import sys
+import threading
+import time
 import uuid
 
 
-@dataclass
+# Shared read-only defaults for contract fields and dict_to_* lookups
+_DEFAULT_NULL_TOKENS = ("", "NA", "N/A", "null", "None")
+_EMPTY_MAPPING = MappingProxyType({})
+
+
+def _intern(value: Any) -> Any:
+    """Intern enum-like string values so repeated ones share one object."""
+    return sys.intern(value) if type(value) is str else value
+
+
+# (epoch second, formatted timestamp) of the last _utc_now_iso() call
+_TIMESTAMP_CACHE = [0, ""]
+
+
+def _utc_now_iso() -> str:
+    """Return the current UTC time as an ISO 8601 string, cached per second."""
+    now = int(time.time())
+    cache = _TIMESTAMP_CACHE
+    if cache[0] != now:
+        cache[0] = now
+        cache[1] = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(now))
+    return cache[1]
+
+
+# Random bytes drawn from os.urandom in 4 KB batches (256 contract IDs each)
+_ID_ENTROPY = bytearray()
+_ID_ENTROPY_POS = 0
+_ID_ENTROPY_LOCK = threading.Lock()
+
+
+def _new_contract_id() -> str:
+    """Return a random (version 4) UUID string for a new contract."""
+    global _ID_ENTROPY_POS
+    with _ID_ENTROPY_LOCK:
+        if _ID_ENTROPY_POS + 16 > len(_ID_ENTROPY):
+            _ID_ENTROPY[:] = os.urandom(4096)
+            _ID_ENTROPY_POS = 0
+        raw = bytes(_ID_ENTROPY[_ID_ENTROPY_POS:_ID_ENTROPY_POS + 16])
+        _ID_ENTROPY_POS += 16
+    return str(uuid.UUID(bytes=raw, version=4))
+
+
+@dataclass(slots=True)
 class AppInfo:
     """Application metadata in the contract."""
 
@@ -19,7 +65,7 @@ class AppInfo:
     version: str = "0.1.0"
 
 
-@dataclass
+@dataclass(slots=True)
 class Limits:
     """Resource limits recorded in the contract."""
 
@@ -28,14 +74,14 @@ class Limits:
     max_columns: int = 100
 
 
-@dataclass
+@dataclass(slots=True)
 class RowLimitBehavior:
     """Row limit behavior configuration."""
 
     reject_if_over_limit: bool = True
 
 
-@dataclass
+@dataclass(slots=True)
 class QuickActions:
     """Quick column name transformation actions."""
 
@@ -47,7 +93,7 @@ class QuickActions:
     replace_spaces_with_underscores: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class ImportSettings:
     """Import settings for file processing.
 
@@ -62,7 +108,7 @@ class ImportSettings:
     quick_actions: QuickActions = field(default_factory=QuickActions)
 
 
-@dataclass
+@dataclass(slots=True)
 class DatasetConfig:
     """Dataset configuration in the contract."""
 
@@ -75,17 +121,18 @@ class DatasetConfig:
     import_settings: ImportSettings = field(default_factory=ImportSettings)
 
 
-@dataclass
+@dataclass(slots=True)
 class Normalization:
     """Column normalization settings."""
 
     trim_whitespace: bool = True
-    null_tokens: list[str] = field(default_factory=lambda: ["", "NA", "N/A", "null", "None"])
+    # Treated as read-only; may be a tuple shared between columns
+    null_tokens: Sequence[str] = _DEFAULT_NULL_TOKENS
     case: str = "none"  # none, lower, upper, title
     remove_non_printable: bool = True
 
 
-@dataclass
+@dataclass(slots=True)
 class FailureHandling:
     """Failure handling configuration."""
 
@@ -94,7 +141,7 @@ class FailureHandling:
     quarantine_export_name: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class TestConfig:
     """Configuration for a single test."""
 
@@ -104,7 +151,7 @@ class TestConfig:
     on_fail: Optional[FailureHandling] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class RemediationConfig:
     """Configuration for a remediation action."""
 
@@ -112,7 +159,7 @@ class RemediationConfig:
     params: dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class ColumnConfig:
     """Configuration for a single column."""
 
@@ -126,7 +173,7 @@ class ColumnConfig:
     failure_handling: FailureHandling = field(default_factory=FailureHandling)
 
 
-@dataclass
+@dataclass(slots=True)
 class DatasetTest:
     """Configuration for a dataset-level test."""
 
@@ -136,14 +183,14 @@ class DatasetTest:
     on_fail: Optional[FailureHandling] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class NullPolicy:
     """Null handling policy for FK checks."""
 
     allow_nulls: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class ForeignKeyCheck:
     """Configuration for a foreign key membership check."""
 
@@ -157,7 +204,7 @@ class ForeignKeyCheck:
     on_fail: FailureHandling = field(default_factory=FailureHandling)
 
 
-@dataclass
+@dataclass(slots=True)
 class ExportConfig:
     """Export configuration."""
 
@@ -168,15 +215,13 @@ class ExportConfig:
     output_format: str = "csv"
 
 
-@dataclass
+@dataclass(slots=True)
 class Contract:
     """Complete Data Doctor contract."""
 
     contract_version: str = "1.0"
-    contract_id: str = field(default_factory=lambda: str(uuid.uuid4()))
-    created_at_utc: str = field(
-        default_factory=lambda: datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ")
-    )
+    contract_id: str = field(default_factory=_new_contract_id)
+    created_at_utc: str = field(default_factory=_utc_now_iso)
     app: AppInfo = field(default_factory=AppInfo)
     limits: Optional[Limits] = field(default_factory=Limits)
     dataset: DatasetConfig = field(default_factory=DatasetConfig)
@@ -185,6 +230,79 @@ class Contract:
     foreign_key_checks: list[ForeignKeyCheck] = field(default_factory=list)
     exports: ExportConfig = field(default_factory=ExportConfig)
 
+    # Lazily built (column count, name -> ColumnConfig) lookup; not serialized
+    _column_index: Optional[tuple[int, dict[str, ColumnConfig]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def get_column(self, name: str) -> Optional[ColumnConfig]:
+        """
+        Look up a column configuration by name.
+
+        The name index is rebuilt whenever the number of columns changes or
+        a cached entry no longer carries the requested name.
+
+        Args:
+            name: Column name
+
+        Returns:
+            ColumnConfig or None if not found
+        """
+        cached = self._column_index
+        if cached is None or cached[0] != len(self.columns):
+            cached = self._build_column_index()
+
+        col = cached[1].get(name)
+        if col is not None and col.name != name:
+            col = self._build_column_index()[1].get(name)
+        return col
+
+    def invalidate_column_index(self) -> None:
+        """Drop the cached column index after mutating column names in place."""
+        self._column_index = None
+
+    def _build_column_index(self) -> tuple[int, dict[str, ColumnConfig]]:
+        """Build and store the column name index (first occurrence wins)."""
+        index = {}
+        for col in self.columns:
+            index.setdefault(col.name, col)
+        self._column_index = (len(self.columns), index)
+        return self._column_index
+
+
+# Serialized field names for each contract dataclass, computed once at import.
+# Private fields are runtime caches, not contract data.
+_FIELDS: dict[type, tuple[str, ...]] = {
+    cls: tuple(f.name for f in fields(cls) if not f.name.startswith("_"))
+    for cls in (
+        AppInfo,
+        Limits,
+        RowLimitBehavior,
+        QuickActions,
+        ImportSettings,
+        DatasetConfig,
+        Normalization,
+        FailureHandling,
+        TestConfig,
+        RemediationConfig,
+        ColumnConfig,
+        DatasetTest,
+        NullPolicy,
+        ForeignKeyCheck,
+        ExportConfig,
+        Contract,
+    )
+}
+
+
+# Every dataclass that makes up a serialized contract
+CONTRACT_DATACLASSES = tuple(_FIELDS)
+
+
+# Returned for every missing on_fail/failure_handling block. Shared safely
+# because callers replace a FailureHandling wholesale rather than editing it.
+_DEFAULT_FAILURE_HANDLING = FailureHandling()
+
 
 def create_default_column_config(
     name: str,
@@ -231,24 +349,71 @@ def contract_to_dict(contract: Contract) -> dict:
     Returns:
         Dictionary representation
     """
+    return _to_plain(contract)
 
-    def dataclass_to_dict(obj: Any) -> Any:
-        """Recursively convert dataclasses to dicts."""
-        if hasattr(obj, "__dataclass_fields__"):
-            result = {}
-            for field_name in obj.__dataclass_fields__:
-                value = getattr(obj, field_name)
-                if value is not None:
-                    result[field_name] = dataclass_to_dict(value)
-            return result
-        elif isinstance(obj, list):
-            return [dataclass_to_dict(item) for item in obj]
-        elif isinstance(obj, dict):
-            return {k: dataclass_to_dict(v) for k, v in obj.items()}
-        else:
-            return obj
-
-    return dataclass_to_dict(contract)
+
+def contract_field_items(obj: Any) -> list[tuple[str, Any]]:
+    """
+    List the serialized (name, value) pairs of a contract dataclass.
+
+    Private fields and None values are left out, matching contract_to_dict.
+
+    Args:
+        obj: An instance of one of CONTRACT_DATACLASSES
+
+    Returns:
+        (field name, value) pairs in declaration order
+    """
+    items = []
+    for field_name in _FIELDS[type(obj)]:
+        value = getattr(obj, field_name)
+        if value is not None:
+            items.append((field_name, value))
+    return items
+
+
+def _to_plain(obj: Any) -> Any:
+    """Recursively convert dataclasses and containers to plain values."""
+    converter = _CONVERTERS.get(type(obj))
+    if converter is None:
+        # Scalars (and anything unrecognised) pass through unchanged
+        return obj
+    return converter(obj)
+
+
+def _sequence_to_plain(items: Any) -> list:
+    """Convert a list or tuple; tuples become lists so YAML stays plain."""
+    return [_to_plain(item) for item in items]
+
+
+def _mapping_to_plain(mapping: dict) -> dict:
+    """Convert the values of a dict."""
+    return {k: _to_plain(v) for k, v in mapping.items()}
+
+
+def _make_dataclass_converter(field_names: tuple[str, ...]):
+    """Build a converter bound to one dataclass's serialized field names."""
+
+    def convert(obj: Any) -> dict:
+        result = {}
+        for field_name in field_names:
+            value = getattr(obj, field_name)
+            if value is not None:
+                result[field_name] = _to_plain(value)
+        return result
+
+    return convert
+
+
+# type(obj) -> converter used by _to_plain, built once at import
+_CONVERTERS = {
+    list: _sequence_to_plain,
+    tuple: _sequence_to_plain,
+    dict: _mapping_to_plain,
+}
+_CONVERTERS.update(
+    (cls, _make_dataclass_converter(field_names)) for cls, field_names in _FIELDS.items()
+)
 
 
 def dict_to_normalization(data: Optional[dict]) -> Optional[Normalization]:
@@ -257,8 +422,8 @@ def dict_to_normalization(data: Optional[dict]) -> Optional[Normalization]:
         return None
     return Normalization(
         trim_whitespace=data.get("trim_whitespace", True),
-        null_tokens=data.get("null_tokens", ["", "NA", "N/A", "null", "None"]),
-        case=data.get("case", "none"),
+        null_tokens=data.get("null_tokens", _DEFAULT_NULL_TOKENS),
+        case=_intern(data.get("case", "none")),
         remove_non_printable=data.get("remove_non_printable", True),
     )
 
@@ -266,9 +431,9 @@ def dict_to_normalization(data: Optional[dict]) -> Optional[Normalization]:
 def dict_to_failure_handling(data: Optional[dict]) -> FailureHandling:
     """Convert a dictionary to a FailureHandling object."""
     if data is None:
-        return FailureHandling()
+        return _DEFAULT_FAILURE_HANDLING
     return FailureHandling(
-        action=data.get("action", "strict_fail"),
+        action=_intern(data.get("action", "strict_fail")),
         label_column_name=data.get("label_column_name"),
         quarantine_export_name=data.get("quarantine_export_name"),
     )
@@ -277,8 +442,8 @@ def dict_to_failure_handling(data: Optional[dict]) -> FailureHandling:
 def dict_to_test_config(data: dict) -> TestConfig:
     """Convert a dictionary to a TestConfig object."""
     return TestConfig(
-        type=data.get("type", ""),
-        severity=data.get("severity", "error"),
+        type=_intern(data.get("type", "")),
+        severity=_intern(data.get("severity", "error")),
         params=data.get("params", {}),
         on_fail=dict_to_failure_handling(data.get("on_fail")),
     )
@@ -287,7 +452,7 @@ def dict_to_test_config(data: dict) -> TestConfig:
 def dict_to_remediation_config(data: dict) -> RemediationConfig:
     """Convert a dictionary to a RemediationConfig object."""
     return RemediationConfig(
-        type=data.get("type", ""),
+        type=_intern(data.get("type", "")),
         params=data.get("params", {}),
     )
 
@@ -296,12 +461,12 @@ def dict_to_column_config(data: dict) -> ColumnConfig:
     """Convert a dictionary to a ColumnConfig object."""
     return ColumnConfig(
         name=data.get("name", ""),
-        data_type=data.get("data_type", "string"),
+        data_type=_intern(data.get("data_type", "string")),
         required=data.get("required", False),
         rename_to=data.get("rename_to"),
         normalization=dict_to_normalization(data.get("normalization")),
-        tests=[dict_to_test_config(t) for t in data.get("tests", [])],
-        remediation=[dict_to_remediation_config(r) for r in data.get("remediation", [])],
+        tests=[dict_to_test_config(t) for t in data.get("tests", ())],
+        remediation=[dict_to_remediation_config(r) for r in data.get("remediation", ())],
         failure_handling=dict_to_failure_handling(data.get("failure_handling")),
     )
 
@@ -317,7 +482,7 @@ def dict_to_contract(data: dict) -> Contract:
         Contract object
     """
     # Parse app info
-    app_data = data.get("app", {})
+    app_data = data.get("app", _EMPTY_MAPPING)
     app = AppInfo(
         name=app_data.get("name", "Data Doctor"),
         version=app_data.get("version", "0.1.0"),
@@ -334,26 +499,20 @@ def dict_to_contract(data: dict) -> Contract:
         )
 
     # Parse dataset config
-    dataset_data = data.get("dataset", {})
-    row_limit_data = dataset_data.get("row_limit_behavior", {})
+    dataset_data = data.get("dataset", _EMPTY_MAPPING)
+    row_limit_data = dataset_data.get("row_limit_behavior", _EMPTY_MAPPING)
 
     # Parse import settings
-    import_data = dataset_data.get("import_settings", {})
-    quick_actions_data = import_data.get("quick_actions", {})
+    import_data = dataset_data.get("import_settings", _EMPTY_MAPPING)
+    quick_actions_data = import_data.get("quick_actions", _EMPTY_MAPPING)
     import_settings = ImportSettings(
         skip_rows=import_data.get("skip_rows", 0),
         skip_footer_rows=import_data.get("skip_footer_rows", 0),
         column_renames=import_data.get("column_renames", {}),
         columns_to_ignore=import_data.get("columns_to_ignore", []),
+        # Every quick action is an off-by-default flag
         quick_actions=QuickActions(
-            to_lowercase=quick_actions_data.get("to_lowercase", False),
-            to_uppercase=quick_actions_data.get("to_uppercase", False),
-            to_titlecase=quick_actions_data.get("to_titlecase", False),
-            trim_whitespace=quick_actions_data.get("trim_whitespace", False),
-            remove_punctuation=quick_actions_data.get("remove_punctuation", False),
-            replace_spaces_with_underscores=quick_actions_data.get(
-                "replace_spaces_with_underscores", False
-            ),
+            **{key: bool(quick_actions_data.get(key)) for key in _FIELDS[QuickActions]}
         ),
     )
 
@@ -370,55 +529,54 @@ def dict_to_contract(data: dict) -> Contract:
     )
 
     # Parse columns
-    columns = [dict_to_column_config(c) for c in data.get("columns", [])]
+    columns = [dict_to_column_config(c) for c in data.get("columns", ())]
 
     # Parse dataset tests
-    dataset_tests = []
-    for dt in data.get("dataset_tests", []):
-        dataset_tests.append(
-            DatasetTest(
-                type=dt.get("type", ""),
-                severity=dt.get("severity", "error"),
-                params=dt.get("params", {}),
-                on_fail=dict_to_failure_handling(dt.get("on_fail")),
-            )
+    dataset_tests = [
+        DatasetTest(
+            type=_intern(dt.get("type", "")),
+            severity=_intern(dt.get("severity", "error")),
+            params=dt.get("params", {}),
+            on_fail=dict_to_failure_handling(dt.get("on_fail")),
         )
+        for dt in data.get("dataset_tests", ())
+    ]
 
     # Parse foreign key checks
-    fk_checks = []
-    for fk in data.get("foreign_key_checks", []):
-        null_policy_data = fk.get("null_policy", {})
-        fk_checks.append(
-            ForeignKeyCheck(
-                name=fk.get("name", ""),
-                dataset_column=fk.get("dataset_column", ""),
-                fk_file=fk.get("fk_file", ""),
-                fk_column=fk.get("fk_column", ""),
-                fk_sheet=fk.get("fk_sheet"),
-                normalization_inherit_from_dataset_column=fk.get(
-                    "normalization_inherit_from_dataset_column", True
-                ),
-                null_policy=NullPolicy(
-                    allow_nulls=null_policy_data.get("allow_nulls", False)
-                ),
-                on_fail=dict_to_failure_handling(fk.get("on_fail")),
-            )
+    fk_checks = [
+        ForeignKeyCheck(
+            name=fk.get("name", ""),
+            dataset_column=fk.get("dataset_column", ""),
+            fk_file=fk.get("fk_file", ""),
+            fk_column=fk.get("fk_column", ""),
+            fk_sheet=fk.get("fk_sheet"),
+            normalization_inherit_from_dataset_column=fk.get(
+                "normalization_inherit_from_dataset_column", True
+            ),
+            null_policy=NullPolicy(
+                allow_nulls=fk.get("null_policy", _EMPTY_MAPPING).get("allow_nulls", False)
+            ),
+            on_fail=dict_to_failure_handling(fk.get("on_fail")),
         )
+        for fk in data.get("foreign_key_checks", ())
+    ]
 
     # Parse exports
-    exports_data = data.get("exports", {})
+    exports_data = data.get("exports", _EMPTY_MAPPING)
     exports = ExportConfig(
         report_html=exports_data.get("report_html", True),
         cleaned_dataset=exports_data.get("cleaned_dataset", False),
         contract_yaml=exports_data.get("contract_yaml", True),
         remediation_summary=exports_data.get("remediation_summary", False),
-        output_format=exports_data.get("output_format", "csv"),
+        output_format=_intern(exports_data.get("output_format", "csv")),
     )
 
     return Contract(
         contract_version=data.get("contract_version", "1.0"),
-        contract_id=data.get("contract_id", str(uuid.uuid4())),
-        created_at_utc=data.get("created_at_utc", datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ")),
+        contract_id=data["contract_id"] if "contract_id" in data else _new_contract_id(),
+        created_at_utc=(
+            data["created_at_utc"] if "created_at_utc" in data else _utc_now_iso()
+        ),
         app=app,
         limits=limits,
         dataset=dataset,
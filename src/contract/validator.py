@@ -5,8 +5,10 @@ This module validates YAML contracts according to Section 24 of the
 acceptance criteria before allowing dataset validation to proceed.
 """
 
+import itertools
 from dataclasses import dataclass
-from typing import Optional
+from types import MappingProxyType
+from typing import Iterator, Optional, Union
 
 from src.constants import (
     COLUMN_TEST_TYPES,
@@ -15,10 +17,30 @@ from src.constants import (
     FAILURE_ACTIONS,
     REMEDIATION_TYPES,
 )
-from src.contract.schema import Contract
+from src.contract.schema import Contract, DatasetTest, FailureHandling, TestConfig
 
+# Set views of the allowed values for O(1) membership checks; the original
+# sequences keep their order for the guidance messages
+_DATA_TYPES_SET = frozenset(DATA_TYPES)
+_FAILURE_ACTIONS_SET = frozenset(FAILURE_ACTIONS)
+_COLUMN_TEST_TYPES_SET = frozenset(COLUMN_TEST_TYPES)
+_DATASET_TEST_TYPES_SET = frozenset(DATASET_TEST_TYPES)
+_REMEDIATION_TYPES_SET = frozenset(REMEDIATION_TYPES)
+_SEVERITY_SET = frozenset(("error", "warning"))
 
-@dataclass
+# Shared read-only stand-in for missing params mappings
+_EMPTY_PARAMS = MappingProxyType({})
+
+
+def _is_one_of(value: object, allowed: frozenset) -> bool:
+    """Check set membership, treating unhashable YAML values (lists, maps) as invalid."""
+    try:
+        return value in allowed
+    except TypeError:
+        return False
+
+
+@dataclass(slots=True)
 class ValidationError:
     """A single validation error."""
 
@@ -35,106 +57,110 @@ class ContractValidationResult:
     errors: list[ValidationError]
 
 
-def validate_contract(contract: Contract) -> ContractValidationResult:
+def validate_contract(contract: Contract, *, fail_fast: bool = False) -> ContractValidationResult:
     """
     Validate a contract according to the rules in Section 24.
 
     Args:
         contract: The Contract to validate
+        fail_fast: Stop at the first error instead of collecting all of them
 
     Returns:
         ContractValidationResult with validation status and any errors
     """
-    errors = []
+    found = _iter_contract_errors(contract)
+    errors = list(itertools.islice(found, 1) if fail_fast else found)
+
+    return ContractValidationResult(
+        is_valid=len(errors) == 0,
+        errors=errors,
+    )
+
+
+def validate_contract_is_valid(contract: Contract) -> bool:
+    """
+    Check whether a contract is valid, stopping at the first error.
+
+    Args:
+        contract: The Contract to validate
+
+    Returns:
+        True if the contract has no validation errors
+    """
+    return next(_iter_contract_errors(contract), None) is None
+
 
+def _iter_contract_errors(contract: Contract) -> Iterator[ValidationError]:
+    """Yield contract errors lazily so callers can stop early."""
     # Validate top-level required fields
-    errors.extend(_validate_top_level(contract))
+    yield from _validate_top_level(contract)
 
     # Validate columns
-    errors.extend(_validate_columns(contract))
+    yield from _validate_columns(contract)
+
+    # Column names referenced by dataset tests and FK checks, built once
+    column_names = frozenset(col.name for col in contract.columns)
 
     # Validate dataset tests
-    errors.extend(_validate_dataset_tests(contract))
+    yield from _validate_dataset_tests(contract, column_names)
 
     # Validate foreign key checks
-    errors.extend(_validate_foreign_key_checks(contract))
-
-    return ContractValidationResult(
-        is_valid=len(errors) == 0,
-        errors=errors,
-    )
+    yield from _validate_foreign_key_checks(contract, column_names)
 
 
-def _validate_top_level(contract: Contract) -> list[ValidationError]:
+def _validate_top_level(contract: Contract) -> Iterator[ValidationError]:
     """Validate top-level required fields."""
-    errors = []
-
     # contract_version is required
     if not contract.contract_version:
-        errors.append(
-            ValidationError(
-                field="contract_version",
-                message="Contract version is required.",
-                guidance="Add 'contract_version: \"1.0\"' to the contract.",
-            )
+        yield ValidationError(
+            field="contract_version",
+            message="Contract version is required.",
+            guidance="Add 'contract_version: \"1.0\"' to the contract.",
         )
 
     # contract_id is required
     if not contract.contract_id:
-        errors.append(
-            ValidationError(
-                field="contract_id",
-                message="Contract ID is required.",
-                guidance="Add a unique 'contract_id' field (can be a UUID).",
-            )
+        yield ValidationError(
+            field="contract_id",
+            message="Contract ID is required.",
+            guidance="Add a unique 'contract_id' field (can be a UUID).",
         )
 
     # created_at_utc is required
     if not contract.created_at_utc:
-        errors.append(
-            ValidationError(
-                field="created_at_utc",
-                message="Creation timestamp is required.",
-                guidance="Add 'created_at_utc' in ISO 8601 format.",
-            )
+        yield ValidationError(
+            field="created_at_utc",
+            message="Creation timestamp is required.",
+            guidance="Add 'created_at_utc' in ISO 8601 format.",
         )
 
     # app is required
     if not contract.app or not contract.app.name:
-        errors.append(
-            ValidationError(
-                field="app",
-                message="Application metadata is required.",
-                guidance="Add 'app' section with 'name' and 'version'.",
-            )
+        yield ValidationError(
+            field="app",
+            message="Application metadata is required.",
+            guidance="Add 'app' section with 'name' and 'version'.",
         )
 
     # dataset is required
     if not contract.dataset:
-        errors.append(
-            ValidationError(
-                field="dataset",
-                message="Dataset configuration is required.",
-                guidance="Add 'dataset' section with 'row_limit_behavior'.",
-            )
+        yield ValidationError(
+            field="dataset",
+            message="Dataset configuration is required.",
+            guidance="Add 'dataset' section with 'row_limit_behavior'.",
         )
 
     # columns is required (and must not be empty)
     if not contract.columns:
-        errors.append(
-            ValidationError(
-                field="columns",
-                message="At least one column must be defined.",
-                guidance="Add 'columns' list with column configurations.",
-            )
+        yield ValidationError(
+            field="columns",
+            message="At least one column must be defined.",
+            guidance="Add 'columns' list with column configurations.",
         )
 
-    return errors
-
 
-def _validate_columns(contract: Contract) -> list[ValidationError]:
+def _validate_columns(contract: Contract) -> Iterator[ValidationError]:
     """Validate column configurations."""
-    errors = []
     column_names = set()
 
     for i, col in enumerate(contract.columns):
@@ -144,178 +170,142 @@ def _validate_columns(contract: Contract) -> list[ValidationError]:
 
         # name is required
         if not col.name:
-            errors.append(
-                ValidationError(
-                    field=f"columns[{i}].name",
-                    message=f"Column {i} is missing a name.",
-                    guidance="Each column must have a 'name' field.",
-                )
+            yield ValidationError(
+                field=f"columns[{i}].name",
+                message=f"Column {i} is missing a name.",
+                guidance="Each column must have a 'name' field.",
             )
         else:
             # Check for duplicate column names
             if col.name in column_names:
-                errors.append(
-                    ValidationError(
-                        field=f"{col_prefix}.name",
-                        message=f"Duplicate column name: '{col.name}'.",
-                        guidance="Each column name must be unique.",
-                    )
+                yield ValidationError(
+                    field=f"{col_prefix}.name",
+                    message=f"Duplicate column name: '{col.name}'.",
+                    guidance="Each column name must be unique.",
                 )
             column_names.add(col.name)
 
         # data_type must be valid
-        if col.data_type not in DATA_TYPES:
-            errors.append(
-                ValidationError(
-                    field=f"{col_prefix}.data_type",
-                    message=f"Invalid data type: '{col.data_type}'.",
-                    guidance=f"Valid data types: {', '.join(DATA_TYPES)}",
-                )
+        if not _is_one_of(col.data_type, _DATA_TYPES_SET):
+            yield ValidationError(
+                field=f"{col_prefix}.data_type",
+                message=f"Invalid data type: '{col.data_type}'.",
+                guidance=f"Valid data types: {', '.join(DATA_TYPES)}",
             )
 
         # Validate failure_handling
-        errors.extend(
-            _validate_failure_handling(
-                col.failure_handling,
-                f"{col_prefix}.failure_handling",
-            )
+        yield from _validate_failure_handling(
+            col.failure_handling,
+            f"{col_prefix}.failure_handling",
         )
 
         # Validate tests
         for j, test in enumerate(col.tests):
             test_prefix = f"{col_prefix}.tests[{j}]"
-            errors.extend(_validate_test(test, test_prefix, is_column_test=True))
+            yield from _validate_test(test, test_prefix, is_column_test=True)
 
             # Special validation for date_rule
             if test.type == "date_rule":
-                errors.extend(_validate_date_rule(test, test_prefix))
+                yield from _validate_date_rule(test, test_prefix)
 
         # Validate remediation
         for j, rem in enumerate(col.remediation):
             rem_prefix = f"{col_prefix}.remediation[{j}]"
-            if rem.type not in REMEDIATION_TYPES:
-                errors.append(
-                    ValidationError(
-                        field=f"{rem_prefix}.type",
-                        message=f"Invalid remediation type: '{rem.type}'.",
-                        guidance=f"Valid types: {', '.join(REMEDIATION_TYPES)}",
-                    )
+            if not _is_one_of(rem.type, _REMEDIATION_TYPES_SET):
+                yield ValidationError(
+                    field=f"{rem_prefix}.type",
+                    message=f"Invalid remediation type: '{rem.type}'.",
+                    guidance=f"Valid types: {', '.join(REMEDIATION_TYPES)}",
                 )
 
-    return errors
-
 
 def _validate_failure_handling(
-    fh: Optional[object],
+    fh: Optional[FailureHandling],
     field_prefix: str,
-) -> list[ValidationError]:
+) -> Iterator[ValidationError]:
     """Validate failure handling configuration."""
-    errors = []
-
     if fh is None:
-        return errors
+        return
 
-    # Access attributes if it's a dataclass
-    action = getattr(fh, "action", None)
-    label_column_name = getattr(fh, "label_column_name", None)
-    quarantine_export_name = getattr(fh, "quarantine_export_name", None)
+    action = fh.action
+    label_column_name = fh.label_column_name
+    quarantine_export_name = fh.quarantine_export_name
 
     # action must be valid
-    if action and action not in FAILURE_ACTIONS:
-        errors.append(
-            ValidationError(
-                field=f"{field_prefix}.action",
-                message=f"Invalid failure action: '{action}'.",
-                guidance=f"Valid actions: {', '.join(FAILURE_ACTIONS)}",
-            )
+    if action and not _is_one_of(action, _FAILURE_ACTIONS_SET):
+        yield ValidationError(
+            field=f"{field_prefix}.action",
+            message=f"Invalid failure action: '{action}'.",
+            guidance=f"Valid actions: {', '.join(FAILURE_ACTIONS)}",
         )
 
     # label_failure requires label_column_name
     if action == "label_failure" and not label_column_name:
-        errors.append(
-            ValidationError(
-                field=f"{field_prefix}.label_column_name",
-                message="label_column_name is required when action is 'label_failure'.",
-                guidance="Add 'label_column_name' to specify the error label column.",
-            )
+        yield ValidationError(
+            field=f"{field_prefix}.label_column_name",
+            message="label_column_name is required when action is 'label_failure'.",
+            guidance="Add 'label_column_name' to specify the error label column.",
         )
 
     # quarantine_row requires quarantine_export_name
     if action == "quarantine_row" and not quarantine_export_name:
-        errors.append(
-            ValidationError(
-                field=f"{field_prefix}.quarantine_export_name",
-                message="quarantine_export_name is required when action is 'quarantine_row'.",
-                guidance="Add 'quarantine_export_name' to specify the quarantine output name.",
-            )
+        yield ValidationError(
+            field=f"{field_prefix}.quarantine_export_name",
+            message="quarantine_export_name is required when action is 'quarantine_row'.",
+            guidance="Add 'quarantine_export_name' to specify the quarantine output name.",
         )
 
-    return errors
-
 
 def _validate_test(
-    test: object,
+    test: Union[TestConfig, DatasetTest],
     field_prefix: str,
     is_column_test: bool,
-) -> list[ValidationError]:
+) -> Iterator[ValidationError]:
     """Validate a test configuration."""
-    errors = []
-
-    test_type = getattr(test, "type", None)
-    severity = getattr(test, "severity", None)
-    on_fail = getattr(test, "on_fail", None)
+    test_type = test.type
+    severity = test.severity
+    on_fail = test.on_fail
 
     # type is required
     if not test_type:
-        errors.append(
-            ValidationError(
-                field=f"{field_prefix}.type",
-                message="Test type is required.",
-                guidance="Add 'type' field to the test.",
-            )
+        yield ValidationError(
+            field=f"{field_prefix}.type",
+            message="Test type is required.",
+            guidance="Add 'type' field to the test.",
         )
     else:
         valid_types = COLUMN_TEST_TYPES if is_column_test else DATASET_TEST_TYPES
-        if test_type not in valid_types:
-            errors.append(
-                ValidationError(
-                    field=f"{field_prefix}.type",
-                    message=f"Invalid test type: '{test_type}'.",
-                    guidance=f"Valid types: {', '.join(valid_types)}",
-                )
+        valid_types_set = _COLUMN_TEST_TYPES_SET if is_column_test else _DATASET_TEST_TYPES_SET
+        if not _is_one_of(test_type, valid_types_set):
+            yield ValidationError(
+                field=f"{field_prefix}.type",
+                message=f"Invalid test type: '{test_type}'.",
+                guidance=f"Valid types: {', '.join(valid_types)}",
             )
 
     # severity must be valid
-    if severity and severity not in ["error", "warning"]:
-        errors.append(
-            ValidationError(
-                field=f"{field_prefix}.severity",
-                message=f"Invalid severity: '{severity}'.",
-                guidance="Severity must be 'error' or 'warning'.",
-            )
+    if severity and not _is_one_of(severity, _SEVERITY_SET):
+        yield ValidationError(
+            field=f"{field_prefix}.severity",
+            message=f"Invalid severity: '{severity}'.",
+            guidance="Severity must be 'error' or 'warning'.",
         )
 
     # Validate on_fail if present
     if on_fail:
-        errors.extend(_validate_failure_handling(on_fail, f"{field_prefix}.on_fail"))
+        yield from _validate_failure_handling(on_fail, f"{field_prefix}.on_fail")
 
-    return errors
 
-
-def _validate_date_rule(test: object, field_prefix: str) -> list[ValidationError]:
+def _validate_date_rule(test: TestConfig, field_prefix: str) -> Iterator[ValidationError]:
     """Validate date_rule test specific requirements."""
-    errors = []
-
-    params = getattr(test, "params", {}) or {}
+    params = test.params or _EMPTY_PARAMS
 
     # target_format is required
     if not params.get("target_format"):
-        errors.append(
-            ValidationError(
-                field=f"{field_prefix}.params.target_format",
-                message="Date rule requires exactly one target_format.",
-                guidance="Add 'target_format' to params (e.g., 'YYYY-MM-DD').",
-            )
+        yield ValidationError(
+            field=f"{field_prefix}.params.target_format",
+            message="Date rule requires exactly one target_format.",
+            guidance="Add 'target_format' to params (e.g., 'YYYY-MM-DD').",
         )
 
     # If mode is "robust", accepted_input_formats is required
@@ -323,128 +313,104 @@ def _validate_date_rule(test: object, field_prefix: str) -> list[ValidationError
     if mode == "robust":
         accepted_formats = params.get("accepted_input_formats")
         if not accepted_formats or not isinstance(accepted_formats, list):
-            errors.append(
-                ValidationError(
-                    field=f"{field_prefix}.params.accepted_input_formats",
-                    message="Robust mode requires accepted_input_formats list.",
-                    guidance="Add 'accepted_input_formats' as a non-empty list.",
-                )
+            yield ValidationError(
+                field=f"{field_prefix}.params.accepted_input_formats",
+                message="Robust mode requires accepted_input_formats list.",
+                guidance="Add 'accepted_input_formats' as a non-empty list.",
             )
         elif len(accepted_formats) == 0:
-            errors.append(
-                ValidationError(
-                    field=f"{field_prefix}.params.accepted_input_formats",
-                    message="accepted_input_formats cannot be empty in robust mode.",
-                    guidance="Add at least one format to accepted_input_formats.",
-                )
+            yield ValidationError(
+                field=f"{field_prefix}.params.accepted_input_formats",
+                message="accepted_input_formats cannot be empty in robust mode.",
+                guidance="Add at least one format to accepted_input_formats.",
             )
 
-    return errors
-
 
-def _validate_dataset_tests(contract: Contract) -> list[ValidationError]:
+def _validate_dataset_tests(
+    contract: Contract,
+    column_names: frozenset,
+) -> Iterator[ValidationError]:
     """Validate dataset-level tests."""
-    errors = []
-    column_names = {col.name for col in contract.columns}
-
     for i, test in enumerate(contract.dataset_tests):
         test_prefix = f"dataset_tests[{i}]"
-        errors.extend(_validate_test(test, test_prefix, is_column_test=False))
+        yield from _validate_test(test, test_prefix, is_column_test=False)
 
         # Validate column references in params
-        params = getattr(test, "params", {}) or {}
+        params = test.params or _EMPTY_PARAMS
 
         # Check key_columns references
-        key_columns = params.get("key_columns", [])
+        key_columns = params.get("key_columns", ())
         for col_name in key_columns:
             if col_name not in column_names:
-                errors.append(
-                    ValidationError(
-                        field=f"{test_prefix}.params.key_columns",
-                        message=f"Referenced column '{col_name}' not found in columns.",
-                        guidance="Ensure all referenced columns are defined in 'columns'.",
-                    )
+                yield ValidationError(
+                    field=f"{test_prefix}.params.key_columns",
+                    message=f"Referenced column '{col_name}' not found in columns.",
+                    guidance="Ensure all referenced columns are defined in 'columns'.",
                 )
 
         # Check cross_field_rule references
         if test.type == "cross_field_rule":
-            if_clause = params.get("if", {})
-            all_not_null = if_clause.get("all_not_null", [])
+            if_clause = params.get("if", _EMPTY_PARAMS)
+            all_not_null = if_clause.get("all_not_null", ())
             for col_name in all_not_null:
                 if col_name not in column_names:
-                    errors.append(
-                        ValidationError(
-                            field=f"{test_prefix}.params.if.all_not_null",
-                            message=f"Referenced column '{col_name}' not found.",
-                            guidance="Ensure all referenced columns are defined.",
-                        )
+                    yield ValidationError(
+                        field=f"{test_prefix}.params.if.all_not_null",
+                        message=f"Referenced column '{col_name}' not found.",
+                        guidance="Ensure all referenced columns are defined.",
                     )
 
-    return errors
 
-
-def _validate_foreign_key_checks(contract: Contract) -> list[ValidationError]:
+def _validate_foreign_key_checks(
+    contract: Contract,
+    column_names: frozenset,
+) -> Iterator[ValidationError]:
     """Validate foreign key check configurations."""
-    errors = []
-    column_names = {col.name for col in contract.columns}
-
     for i, fk in enumerate(contract.foreign_key_checks):
         fk_prefix = f"foreign_key_checks[{i}]"
 
         # name is required
         if not fk.name:
-            errors.append(
-                ValidationError(
-                    field=f"{fk_prefix}.name",
-                    message="Foreign key check name is required.",
-                    guidance="Add a descriptive 'name' for the FK check.",
-                )
+            yield ValidationError(
+                field=f"{fk_prefix}.name",
+                message="Foreign key check name is required.",
+                guidance="Add a descriptive 'name' for the FK check.",
             )
 
         # dataset_column must exist in columns
         if fk.dataset_column and fk.dataset_column not in column_names:
-            errors.append(
-                ValidationError(
-                    field=f"{fk_prefix}.dataset_column",
-                    message=f"Dataset column '{fk.dataset_column}' not found.",
-                    guidance="Ensure the referenced column is defined in 'columns'.",
-                )
+            yield ValidationError(
+                field=f"{fk_prefix}.dataset_column",
+                message=f"Dataset column '{fk.dataset_column}' not found.",
+                guidance="Ensure the referenced column is defined in 'columns'.",
             )
 
         # fk_file is required
         if not fk.fk_file:
-            errors.append(
-                ValidationError(
-                    field=f"{fk_prefix}.fk_file",
-                    message="FK file reference is required.",
-                    guidance="Add 'fk_file' with the FK list filename.",
-                )
+            yield ValidationError(
+                field=f"{fk_prefix}.fk_file",
+                message="FK file reference is required.",
+                guidance="Add 'fk_file' with the FK list filename.",
             )
 
         # fk_column is required
         if not fk.fk_column:
-            errors.append(
-                ValidationError(
-                    field=f"{fk_prefix}.fk_column",
-                    message="FK column is required.",
-                    guidance="Add 'fk_column' with the FK column name.",
-                )
+            yield ValidationError(
+                field=f"{fk_prefix}.fk_column",
+                message="FK column is required.",
+                guidance="Add 'fk_column' with the FK column name.",
             )
 
         # normalization_inherit_from_dataset_column must be true in v1
         if not fk.normalization_inherit_from_dataset_column:
-            errors.append(
-                ValidationError(
-                    field=f"{fk_prefix}.normalization_inherit_from_dataset_column",
-                    message="Must be true in v1.",
-                    guidance="Set 'normalization_inherit_from_dataset_column: true'.",
-                )
+            yield ValidationError(
+                field=f"{fk_prefix}.normalization_inherit_from_dataset_column",
+                message="Must be true in v1.",
+                guidance="Set 'normalization_inherit_from_dataset_column: true'.",
             )
 
         # Validate on_fail
-        errors.extend(_validate_failure_handling(fk.on_fail, f"{fk_prefix}.on_fail"))
-
-    return errors
+        yield from _validate_failure_handling(fk.on_fail, f"{fk_prefix}.on_fail")
 
 
 def format_validation_errors(result: ContractValidationResult) -> str:
@@ -460,9 +426,8 @@ def format_validation_errors(result: ContractValidationResult) -> str:
     if result.is_valid:
         return "Contract is valid."
 
-    lines = ["Contract validation failed:"]
+    parts = ["Contract validation failed:"]
     for error in result.errors:
-        lines.append(f"\n- {error.field}: {error.message}")
-        lines.append(f"  Guidance: {error.guidance}")
+        parts.extend(("\n\n- ", error.field, ": ", error.message, "\n  Guidance: ", error.guidance))
 
-    return "\n".join(lines)
+    return "".join(parts)
@@ -5,13 +5,35 @@ This module provides functions to export DataFrames to CSV and Excel
 formats with proper escaping to prevent formula injection attacks.
 """
 
+import importlib.util
 import io
-from typing import Any, Optional
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, BinaryIO, Optional
 
+import numpy as np
 import pandas as pd
 
 from src.constants import FORMULA_INJECTION_CHARS
 
+# Leading characters that trigger escaping, as a tuple for str.startswith()
+_FORMULA_PREFIXES = tuple(FORMULA_INJECTION_CHARS)
+
+# The same check as a regex for pyarrow's vectorized matcher. pyarrow is
+# optional (it ships with Streamlit) and is only imported when escaping.
+_FORMULA_PREFIX_REGEX = "^[" + "".join(re.escape(c) for c in FORMULA_INJECTION_CHARS) + "]"
+_HAS_PYARROW = importlib.util.find_spec("pyarrow") is not None
+
+# Excel engine preference: xlsxwriter writes faster than openpyxl and can be
+# told never to turn strings into formulas or links. openpyxl is the fallback
+# when xlsxwriter isn't installed.
+EXCEL_ENGINE = "xlsxwriter" if importlib.util.find_spec("xlsxwriter") else "openpyxl"
+
+# xlsxwriter workbook options. constant_memory stays off: pandas writes
+# cells column by column, which that row-streaming mode would drop.
+_XLSXWRITER_OPTIONS = {"strings_to_formulas": False, "strings_to_urls": False}
+
 
 def escape_formula_injection(value: Any) -> Any:
     """
@@ -26,10 +48,7 @@ def escape_formula_injection(value: Any) -> Any:
     Returns:
         Escaped value (string values only; others returned unchanged)
     """
-    if not isinstance(value, str):
-        return value
-
-    if value and value[0] in FORMULA_INJECTION_CHARS:
+    if isinstance(value, str) and value.startswith(_FORMULA_PREFIXES):
         return "'" + value
 
     return value
@@ -39,23 +58,75 @@ def escape_dataframe(df: pd.DataFrame) -> pd.DataFrame:
     """
     Create a copy of a DataFrame with formula injection prevention.
 
+    If no value needs escaping, the original DataFrame is returned as-is.
+
     Args:
         df: The DataFrame to escape
 
     Returns:
-        New DataFrame with escaped string values
+        New DataFrame with escaped string values, or df itself if unchanged
     """
-    # Create a copy to avoid modifying the original
-    escaped_df = df.copy()
-
-    # Apply escaping to all string columns
-    for col in escaped_df.columns:
-        if escaped_df[col].dtype == object:  # String columns
-            escaped_df[col] = escaped_df[col].apply(escape_formula_injection)
+    # Escape string columns: build a boolean mask over the raw object array
+    # in one pass, then rewrite only the matching cells
+    escaped_columns = {}
+    for position in range(df.shape[1]):
+        series = df.iloc[:, position]
+        if not pd.api.types.is_string_dtype(series.dtype):  # String columns
+            continue
+
+        values = series.to_numpy()
+        mask = _formula_mask(values)
+        if mask.any():
+            escaped = values.copy()
+            escaped[mask] = ["'" + v for v in values[mask]]
+            escaped_columns[position] = pd.Series(
+                escaped, index=series.index, name=series.name, dtype=series.dtype
+            )
+
+    if not escaped_columns:
+        return df
+
+    # Shallow copy: unchanged columns share data with the original
+    escaped_df = df.copy(deep=False)
+    for position, escaped in escaped_columns.items():
+        escaped_df.isetitem(position, escaped)
 
     return escaped_df
 
 
+def _formula_mask(values: np.ndarray) -> np.ndarray:
+    """
+    Flag the cells of an object array that start with a formula character.
+
+    All-string columns are matched with a pyarrow compute kernel when pyarrow
+    is installed; mixed-type columns fall back to a single Python pass.
+
+    Args:
+        values: Object array of column values
+
+    Returns:
+        Boolean array, True where the value is a string needing escaping
+    """
+    if _HAS_PYARROW:
+        import pyarrow as pa
+        import pyarrow.compute as pc
+
+        try:
+            arrow_values = pa.array(values, from_pandas=True)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            arrow_values = None
+
+        if arrow_values is not None and pa.types.is_string(arrow_values.type):
+            matches = pc.match_substring_regex(arrow_values, _FORMULA_PREFIX_REGEX)
+            return pc.fill_null(matches, False).to_numpy(zero_copy_only=False)
+
+    return np.fromiter(
+        (isinstance(v, str) and v.startswith(_FORMULA_PREFIXES) for v in values),
+        dtype=bool,
+        count=len(values),
+    )
+
+
 def export_to_csv(
     df: pd.DataFrame,
     escape_formulas: bool = True,
@@ -74,17 +145,45 @@ def export_to_csv(
     Returns:
         CSV content as bytes
     """
+    buffer = io.BytesIO()
+    export_to_csv_stream(
+        df,
+        buffer,
+        escape_formulas=escape_formulas,
+        encoding=encoding,
+        index=index,
+    )
+
+    return buffer.getvalue()
+
+
+def export_to_csv_stream(
+    df: pd.DataFrame,
+    out: BinaryIO,
+    escape_formulas: bool = True,
+    encoding: str = "utf-8",
+    index: bool = False,
+) -> None:
+    """
+    Write a DataFrame as CSV straight into a binary file-like object.
+
+    pandas encodes while writing, so no intermediate str copy of the
+    whole CSV is built.
+
+    Args:
+        df: The DataFrame to export
+        out: Binary file-like object to write to
+        escape_formulas: Whether to escape formula injection characters
+        encoding: Output encoding
+        index: Whether to include the index column
+    """
     # Apply formula escaping if requested
     if escape_formulas:
         df_to_export = escape_dataframe(df)
     else:
         df_to_export = df
 
-    # Create buffer and write CSV
-    buffer = io.StringIO()
-    df_to_export.to_csv(buffer, index=index, encoding=encoding)
-
-    return buffer.getvalue().encode(encoding)
+    df_to_export.to_csv(out, index=index, encoding=encoding)
 
 
 def export_to_excel(
@@ -113,12 +212,23 @@ def export_to_excel(
 
     # Create buffer and write Excel
     buffer = io.BytesIO()
-    with pd.ExcelWriter(buffer, engine="openpyxl") as writer:
+    with _excel_writer(buffer) as writer:
         df_to_export.to_excel(writer, sheet_name=sheet_name, index=index)
 
     return buffer.getvalue()
 
 
+def _excel_writer(buffer: BinaryIO) -> pd.ExcelWriter:
+    """Open an ExcelWriter on the buffer using the preferred engine."""
+    if EXCEL_ENGINE == "xlsxwriter":
+        return pd.ExcelWriter(
+            buffer,
+            engine="xlsxwriter",
+            engine_kwargs={"options": _XLSXWRITER_OPTIONS},
+        )
+    return pd.ExcelWriter(buffer, engine="openpyxl")
+
+
 def export_dataframe(
     df: pd.DataFrame,
     output_format: str = "csv",
@@ -179,16 +289,20 @@ def export_multiple_sheets(
     Returns:
         Excel file content as bytes
     """
-    buffer = io.BytesIO()
+    # Apply formula escaping if requested. Sheets are escaped concurrently;
+    # the Arrow matching kernel releases the GIL. Writing stays sequential.
+    sheets = list(dataframes.items())
+    if escape_formulas and len(sheets) > 1:
+        with ThreadPoolExecutor(max_workers=min(len(sheets), os.cpu_count() or 1)) as pool:
+            escaped = list(pool.map(escape_dataframe, (df for _, df in sheets)))
+        sheets = [(name, df) for (name, _), df in zip(sheets, escaped)]
+    elif escape_formulas:
+        sheets = [(name, escape_dataframe(df)) for name, df in sheets]
 
-    with pd.ExcelWriter(buffer, engine="openpyxl") as writer:
-        for sheet_name, df in dataframes.items():
-            # Apply formula escaping if requested
-            if escape_formulas:
-                df_to_export = escape_dataframe(df)
-            else:
-                df_to_export = df
+    buffer = io.BytesIO()
 
+    with _excel_writer(buffer) as writer:
+        for sheet_name, df_to_export in sheets:
             # Truncate sheet name to Excel's 31 character limit
             safe_sheet_name = sheet_name[:31]
 
@@ -7,8 +7,10 @@ codes as specified in Section 23.2 of the acceptance criteria.
 
 import re
 from datetime import datetime
+from functools import lru_cache
 from typing import Optional
 
+import numpy as np
 import pandas as pd
 
 
@@ -56,6 +58,28 @@ TOKEN_TO_STRFTIME = {
 }
 
 
+# Reverse mapping for strftime_to_human_format (later tokens win on
+# shared codes, e.g. %p -> "a")
+STRFTIME_TO_TOKEN = {v: k for k, v in TOKEN_TO_STRFTIME.items()}
+
+
+def _alternation(tokens) -> re.Pattern:
+    """Compile a regex matching any token, longest first."""
+    return re.compile(
+        "|".join(re.escape(t) for t in sorted(tokens, key=len, reverse=True))
+    )
+
+
+# Single-pass token matchers; replacing in one scan means substituted
+# codes (like the "m" in "%m") are never rewritten again
+_HUMAN_TOKEN_RE = _alternation(TOKEN_TO_STRFTIME)
+_STRFTIME_CODE_RE = _alternation(STRFTIME_TO_TOKEN)
+
+
+# Offsets at or beyond this many nanoseconds overflow pd.Timedelta
+_INT64_NS_LIMIT = float(2**63)
+
+
 # Common date format patterns (human-readable to strftime)
 COMMON_DATE_FORMATS = {
     "YYYY-MM-DD": "%Y-%m-%d",
@@ -77,6 +101,7 @@ COMMON_DATE_FORMATS = {
 }
 
 
+@lru_cache(maxsize=512)
 def human_format_to_strftime(human_format: str) -> str:
     """
     Convert a human-readable date format to Python strftime format.
@@ -91,17 +116,13 @@ def human_format_to_strftime(human_format: str) -> str:
     if human_format in COMMON_DATE_FORMATS:
         return COMMON_DATE_FORMATS[human_format]
 
-    # Otherwise, do token replacement
-    # Sort tokens by length (longest first) to avoid partial replacements
-    result = human_format
-    sorted_tokens = sorted(TOKEN_TO_STRFTIME.keys(), key=len, reverse=True)
-
-    for token in sorted_tokens:
-        result = result.replace(token, TOKEN_TO_STRFTIME[token])
-
-    return result
+    # Otherwise, do token replacement (longest tokens match first)
+    return _HUMAN_TOKEN_RE.sub(
+        lambda match: TOKEN_TO_STRFTIME[match.group(0)], human_format
+    )
 
 
+@lru_cache(maxsize=512)
 def strftime_to_human_format(strftime_format: str) -> str:
     """
     Convert a strftime format to human-readable format.
@@ -112,17 +133,10 @@ def strftime_to_human_format(strftime_format: str) -> str:
     Returns:
         Human-readable format string like "YYYY-MM-DD"
     """
-    # Reverse mapping
-    strftime_to_token = {v: k for k, v in TOKEN_TO_STRFTIME.items()}
-
-    result = strftime_format
-    # Sort by length to handle longer patterns first
-    sorted_strftime = sorted(strftime_to_token.keys(), key=len, reverse=True)
-
-    for strftime_code in sorted_strftime:
-        result = result.replace(strftime_code, strftime_to_token[strftime_code])
-
-    return result
+    # Longer codes (like "%-m") match before their prefixes
+    return _STRFTIME_CODE_RE.sub(
+        lambda match: STRFTIME_TO_TOKEN[match.group(0)], strftime_format
+    )
 
 
 def parse_date_with_format(
@@ -194,6 +208,49 @@ def parse_excel_serial_date(
         return None
 
 
+def parse_excel_serial_dates(
+    values: pd.Series,
+    date_system: str = "1900",
+) -> pd.Series:
+    """
+    Parse a column of Excel serial date numbers.
+
+    Batch counterpart of parse_excel_serial_date: the conversion is plain
+    int64 nanosecond arithmetic over the whole array, computed the same
+    way pd.Timedelta(days=value) does so results match to the nanosecond.
+
+    Args:
+        values: Numeric serial date numbers
+        date_system: "1900" (Windows) or "1904" (Mac)
+
+    Returns:
+        datetime64[ns] Series aligned with values, NaT where the scalar
+        parser would return None
+    """
+    if date_system == "1904":
+        # Mac Excel uses 1904-01-01 as day 0
+        base = pd.Timestamp("1904-01-01")
+    else:
+        # Windows Excel uses 1899-12-30 as day 0 (due to Lotus 123 bug)
+        base = pd.Timestamp("1899-12-30")
+
+    offsets = values.to_numpy(dtype=np.float64) * 24 * 3600 * 1e9
+
+    # Offsets must fit a pd.Timedelta and land inside the pd.Timestamp range
+    valid = (
+        (np.abs(offsets) < _INT64_NS_LIMIT)
+        & (offsets >= pd.Timestamp.min.value - base.value)
+        & (offsets <= pd.Timestamp.max.value - base.value)
+    )
+    nanoseconds = np.full(len(offsets), np.iinfo(np.int64).min, dtype=np.int64)
+    nanoseconds[valid] = base.value + offsets[valid].astype(np.int64)
+
+    return pd.Series(
+        nanoseconds.view("datetime64[ns]"),
+        index=values.index,
+    )
+
+
 def try_parse_date_robust(
     value: str,
     accepted_formats: list[str],
@@ -233,6 +290,86 @@ def try_parse_date_robust(
     return None, None
 
 
+# Strings pd.to_datetime turns into the current time regardless of format
+_PANDAS_DATE_KEYWORDS = frozenset({"today", "now"})
+
+
+def parse_date_column(
+    series: pd.Series,
+    accepted_formats: list[str],
+    excel_serial_enabled: bool = False,
+) -> pd.Series:
+    """
+    Parse a whole column of dates, trying each accepted format in order.
+
+    Batch counterpart of try_parse_date_robust: each format is one
+    vectorized pd.to_datetime call over the values still unparsed. Values
+    pandas cannot parse (e.g. years outside its nanosecond range) are
+    retried one by one with try_parse_date_robust, as are the "today" and
+    "now" keywords pandas would otherwise turn into the current time, so
+    exactly the same values parse as when calling it per value. Only a value whose first
+    matching format gives a year pandas can't hold may take its date from
+    a later format instead.
+
+    Args:
+        series: The column data (null values are left unparsed)
+        accepted_formats: List of human-readable formats to try
+        excel_serial_enabled: Whether to try Excel serial date parsing
+
+    Returns:
+        datetime64[us] Series aligned with series, NaT where unparsed
+    """
+    # Work on positions so duplicate index labels can't collide
+    values = pd.Series(series.to_numpy(), copy=False)
+    result = pd.Series(pd.NaT, index=values.index, dtype="datetime64[us]")
+    remaining = values[values.notna()].astype(str).str.strip()
+
+    # Try Excel serial dates first if enabled
+    if excel_serial_enabled and len(remaining) > 0:
+        serials = pd.to_numeric(remaining, errors="coerce")
+        in_range = serials.between(1, 2958465)
+        if in_range.any():
+            parsed = parse_excel_serial_dates(serials[in_range]).dropna()
+            result[parsed.index] = parsed
+            remaining = remaining.drop(parsed.index)
+
+    # pandas reads "today" and "now" as the current time under any format;
+    # leave them to the per-value parser, which rejects them
+    keywords = remaining.str.casefold().isin(_PANDAS_DATE_KEYWORDS)
+    fallback = remaining[keywords]
+    remaining = remaining[~keywords]
+
+    # Try each format in order on whatever is still unparsed
+    for fmt in accepted_formats:
+        if len(remaining) == 0:
+            break
+        try:
+            parsed = pd.to_datetime(
+                remaining,
+                format=human_format_to_strftime(fmt),
+                errors="coerce",
+            ).dropna()
+        except ValueError:
+            continue  # Format pandas can't use; the fallback below covers it
+        if not pd.api.types.is_datetime64_dtype(parsed):
+            continue  # Timezone-aware; the fallback below covers it
+        result[parsed.index] = parsed
+        remaining = remaining.drop(parsed.index)
+
+    # Anything pandas couldn't parse gets the per-value parser
+    for idx, value in pd.concat([remaining, fallback]).items():
+        parsed_value, _ = try_parse_date_robust(
+            value,
+            accepted_formats,
+            excel_serial_enabled,
+        )
+        if parsed_value is not None:
+            result[idx] = parsed_value
+
+    result.index = series.index
+    return result
+
+
 def get_common_format_names() -> list[str]:
     """
     Get list of common format names for UI display.
@@ -250,25 +387,29 @@ def get_format_examples() -> list[dict]:
     Returns:
         List of dicts with format and example
     """
+    return [
+        {"format": human_format, "example": example}
+        for human_format, example in _format_examples()
+    ]
+
+
+@lru_cache(maxsize=1)
+def _format_examples() -> tuple[tuple[str, str], ...]:
+    """Render the example date once per format; the formats never change."""
     now = datetime(2025, 1, 7, 14, 32, 10)
     result = []
 
     for human_format, strftime_format in COMMON_DATE_FORMATS.items():
         try:
             example = now.strftime(strftime_format)
-            result.append({
-                "format": human_format,
-                "example": example,
-            })
         except Exception:
-            result.append({
-                "format": human_format,
-                "example": "(example unavailable)",
-            })
+            example = "(example unavailable)"
+        result.append((human_format, example))
 
-    return result
+    return tuple(result)
 
 
+@lru_cache(maxsize=512)
 def validate_date_format_string(human_format: str) -> tuple[bool, Optional[str]]:
     """
     Validate that a date format string is valid.
@@ -161,8 +161,8 @@ def _infer_column_type(series: pd.Series) -> str:
     elif "datetime" in dtype_str:
         return "datetime"
 
-    # For object dtype, sample values
-    if series.dtype == object:
+    # For string columns (object or pandas string dtype), sample values
+    if pd.api.types.is_string_dtype(series.dtype):
         non_null = series.dropna()
         if len(non_null) == 0:
             return "unknown"
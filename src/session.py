@@ -64,10 +64,6 @@ def initialize_session_state() -> None:
 
         # Error state
         "last_error": None,
-
-        # Page navigation
-        "show_about_page": False,
-        "show_privacy_page": False,
     }
 
     for key, default_value in defaults.items():
@@ -144,6 +140,16 @@ def set_current_step(step: int) -> None:
     st.session_state["current_step"] = new_step
 
 
+def peek_step_change() -> bool:
+    """
+    Check if a step change occurred without clearing the flag.
+
+    Returns:
+        True if the step changed since the flag was last consumed
+    """
+    return st.session_state.get("_step_changed", False)
+
+
 def consume_step_change() -> bool:
     """
     Check if a step change occurred and clear the flag.
@@ -5,6 +5,7 @@ This module provides styled components, info tooltips, and other
 reusable UI elements used throughout the Data Doctor interface.
 """
 
+import functools
 from typing import Any, Callable, Optional
 
 import streamlit as st
@@ -18,6 +19,20 @@ from src.ui.theme import (
     get_status_badge_html,
 )
 
+# Sidebar step-row templates (current step highlighted, future steps muted)
+_SIDEBAR_STEP_TEMPLATES = {
+    "current": (
+        '<div style="background-color: #C6F6D5; padding: 8px 12px; '
+        'border-radius: 6px; border-left: 4px solid #2F855A; margin: 4px 0;">'
+        '<span style="font-weight: 600; color: #22543D;">'
+        '{emoji} {name}</span></div>'
+    ),
+    "future": (
+        '<div style="padding: 8px 12px; color: #A0AEC0; margin: 4px 0;">'
+        '{emoji} {name}</div>'
+    ),
+}
+
 
 def info_tooltip(key: str) -> None:
     """
@@ -275,8 +290,42 @@ def progress_indicator(current_step: int, total_steps: int = 6) -> None:
         current_step: Current step number (1-based)
         total_steps: Total number of steps
     """
-    progress = current_step / total_steps
-    st.progress(progress, text=f"Step {current_step} of {total_steps}")
+    progress, text = _progress_state(current_step, total_steps)
+    st.progress(progress, text=text)
+
+
+@functools.lru_cache(maxsize=8)
+def _progress_state(current_step: int, total_steps: int) -> tuple[float, str]:
+    """
+    Compute the progress fraction and label for the progress indicator.
+
+    Args:
+        current_step: Current step number (1-based)
+        total_steps: Total number of steps
+
+    Returns:
+        Tuple of (progress fraction, label text)
+    """
+    return current_step / total_steps, f"Step {current_step} of {total_steps}"
+
+
+@functools.lru_cache(maxsize=64)
+def sidebar_step_html(step_emoji: str, step_name: str, state: str) -> str:
+    """
+    Build the HTML for a non-clickable sidebar step row.
+
+    Results are memoized per (emoji, name, state) since the rows never
+    change between reruns.
+
+    Args:
+        step_emoji: Number emoji for the step
+        step_name: Display name of the step
+        state: Either "current" or "future"
+
+    Returns:
+        HTML string for the step row
+    """
+    return _SIDEBAR_STEP_TEMPLATES[state].format(emoji=step_emoji, name=step_name)
 
 
 def file_size_display(size_bytes: int) -> str:
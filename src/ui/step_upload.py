@@ -46,6 +46,7 @@ from src.ui.components import (
     navigation_buttons,
     demo_tip,
 )
+from src.contract.parser import ContractParseError, parse_yaml_file_path
 from src.contract.schema import dict_to_contract
 
 
@@ -264,33 +265,17 @@ def _process_contract_and_data(contract_file, data_file):
 
         file_ext = validation_result.file_extension
 
-        # Handle Excel sheet selection if needed
-        if file_ext in {".xlsx", ".xls", ".xlsb"}:
-            sheet_result = get_excel_sheet_names(data_content, file_ext)
-            if not sheet_result.success:
-                error_box(sheet_result.error_message)
-                return
-
-            if len(sheet_result.sheet_names) > 1:
-                # For now, use the first sheet. Could add sheet selection later.
-                sheet_name = sheet_result.sheet_names[0]
-                info_box(f"Using first sheet: {sheet_name}")
-            else:
-                sheet_name = sheet_result.sheet_names[0]
-        else:
-            sheet_name = None
-
         # Get import settings from contract
         import_settings = contract.dataset.import_settings
         skip_rows = import_settings.skip_rows
         skip_footer_rows = import_settings.skip_footer_rows
 
-        # Read the file
+        # Read the file (Excel files use their first sheet, and the
+        # workbook is only opened once)
         read_result = read_file(
             data_content,
             data_file.name,
             file_ext,
-            sheet_name=sheet_name,
             skip_rows=skip_rows,
             skip_footer_rows=skip_footer_rows,
         )
@@ -299,6 +284,14 @@ def _process_contract_and_data(contract_file, data_file):
             error_box(read_result.error_message)
             return
 
+        if read_result.sheet_names:
+            sheet_name = read_result.sheet_names[0]
+            if len(read_result.sheet_names) > 1:
+                # For now, use the first sheet. Could add sheet selection later.
+                info_box(f"Using first sheet: {sheet_name}")
+        else:
+            sheet_name = None
+
         df = read_result.dataframe
 
         # Validate dataframe
@@ -393,11 +386,10 @@ def _render_demo_mode():
             # Read the demo CSV
             df = pd.read_csv(demo_csv_path)
 
-            # Read the demo contract
-            with open(demo_contract_path, "r", encoding="utf-8") as f:
-                contract_data = yaml.safe_load(f)
-
-            contract = dict_to_contract(contract_data)
+            # Read the demo contract (cached until the file changes)
+            contract, contract_error = parse_yaml_file_path(demo_contract_path)
+            if contract is None:
+                raise ContractParseError(contract_error)
 
             # Read file content for hash
             with open(demo_csv_path, "rb") as f:
@@ -5,6 +5,8 @@ Centralized branding constants for colors, typography, and styling.
 Based on brandingrequirements.md specifications.
 """
 
+import functools
+
 # =============================================================================
 # BRAND COLORS
 # =============================================================================
@@ -35,15 +37,38 @@ FONT_MONO = "JetBrains Mono, SFMono-Regular, Consolas, 'Liberation Mono', monosp
 
 APP_TAGLINE = "Diagnose and treat your spreadsheet ailments."
 
+# Page header (green title, coal tagline). Inline styles guarantee they
+# override Streamlit defaults. Built once at import since it never changes.
+HEADER_HTML = (
+    f'<h1 style="color: {BRAND_GREEN}; font-size: 2.25rem; font-weight: 700; '
+    f'margin: 0 0 0.25rem 0; padding: 0; line-height: 1.1;">Data Doctor</h1>'
+    f'<p style="color: {BRAND_SLATE}; font-size: 1rem; font-style: italic; '
+    f'margin: 0 0 1rem 0; padding: 0;">{APP_TAGLINE}</p>'
+)
+
+# Compact sidebar branding block
+SIDEBAR_BRANDING_HTML = (
+    f'<div style="margin-bottom: 0.75rem;">'
+    f'<span style="color: {BRAND_GREEN}; font-size: 1.25rem; font-weight: 700; '
+    f'display: block; line-height: 1.2;">Data Doctor</span>'
+    f'<span style="color: {BRAND_SLATE}; font-size: 0.8rem; font-style: italic; '
+    f'display: block; margin-top: 0.15rem;">{APP_TAGLINE}</span>'
+    f'</div>'
+)
+
 # =============================================================================
 # CSS INJECTION
 # =============================================================================
 
 
+@functools.lru_cache(maxsize=None)
 def get_custom_css() -> str:
     """
     Get custom CSS for font and styling injection.
 
+    The CSS is static, so it is built once per process and reused on
+    every Streamlit rerun.
+
     Returns:
         CSS string to inject via st.markdown
     """
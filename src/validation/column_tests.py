@@ -14,8 +14,8 @@ from src.constants import (
     BOOLEAN_TRUE_TOKENS,
 )
 from src.presets.date_formats import (
+    parse_date_column,
     parse_date_with_format,
-    try_parse_date_robust,
 )
 from src.presets.enums import get_enum_preset, validate_with_custom_enum
 from src.presets.patterns import (
@@ -663,23 +663,17 @@ def test_date_rule(
     failed_values = []
     error_details = []
 
-    for idx, value in series.items():
-        if pd.isna(value):
-            continue
-
-        parsed, matched = try_parse_date_robust(
-            str(value),
-            accepted_formats,
-            excel_serial,
-        )
-
-        if parsed is None:
-            failed_indices.append(idx)
-            failed_values.append(value)
-            if len(error_details) < 10:
-                error_details.append(
-                    f"Row {idx}: '{value}' is not a valid date"
-                )
+    # Parse the whole column at once; non-null values left NaT failed
+    parsed = parse_date_column(series, accepted_formats, excel_serial)
+    failed = series.notna().to_numpy() & parsed.isna().to_numpy()
+
+    for idx, value in series[failed].items():
+        failed_indices.append(idx)
+        failed_values.append(value)
+        if len(error_details) < 10:
+            error_details.append(
+                f"Row {idx}: '{value}' is not a valid date"
+            )
 
     return ColumnTestResult(
         column_name=column_name,
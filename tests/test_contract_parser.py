@@ -0,0 +1,59 @@
+"""Tests for contract parsing and serialization."""
+
+import math
+from pathlib import Path
+
+import pytest
+
+from src.contract.parser import parse_yaml_contract, serialize_contract_to_yaml
+
+DEMO_CONTRACT = Path(__file__).parent.parent / "assets" / "demo_contract.yaml"
+
+
+@pytest.fixture
+def contract():
+    contract, error = parse_yaml_contract(DEMO_CONTRACT.read_text(encoding="utf-8"))
+    assert error is None
+    return contract
+
+
+def _range_params(contract):
+    return next(
+        test.params
+        for column in contract.columns
+        for test in column.tests
+        if test.type == "range"
+    )
+
+
+@pytest.mark.parametrize("pretty", [True, False])
+def test_serialize_round_trips(contract, pretty):
+    params = _range_params(contract)
+    params["min"] = 1e-05
+    params["max"] = 1.5e20
+    params["step"] = -2e-300
+    params["label"] = '1e-05 "NaN" Infinity'
+
+    yaml_content = serialize_contract_to_yaml(contract, pretty=pretty)
+    reparsed, error = parse_yaml_contract(yaml_content)
+
+    assert error is None
+    assert reparsed == contract
+
+
+@pytest.mark.parametrize("pretty", [True, False])
+def test_serialize_round_trips_non_finite_floats(contract, pretty):
+    params = _range_params(contract)
+    params["min"] = float("-inf")
+    params["max"] = float("inf")
+    params["step"] = float("nan")
+
+    reparsed, error = parse_yaml_contract(
+        serialize_contract_to_yaml(contract, pretty=pretty)
+    )
+
+    assert error is None
+    reparsed_params = _range_params(reparsed)
+    assert reparsed_params["min"] == float("-inf")
+    assert reparsed_params["max"] == float("inf")
+    assert math.isnan(reparsed_params["step"])
@@ -0,0 +1,24 @@
+"""Tests for batch date parsing."""
+
+import pandas as pd
+import pytest
+
+from src.validation import column_tests
+
+
+@pytest.mark.parametrize("fmt", ["YYYY-MM-DD", "MM/DD/YYYY", "YYYYMMDD"])
+@pytest.mark.parametrize("value", ["today", "now", "Today", "NOW"])
+def test_date_rule_rejects_pandas_keywords(fmt, value):
+    series = pd.Series(["2025-01-07", value])
+    result = column_tests.test_date_rule(
+        series,
+        "shipped",
+        params={
+            "mode": "advanced",
+            "accepted_input_formats": ["YYYY-MM-DD", fmt],
+        },
+    )
+
+    assert not result.passed
+    assert result.failed_indices == [1]
+    assert result.failed_values == [value]
@@ -0,0 +1,17 @@
+"""Tests for the CSV readers."""
+
+import pytest
+
+from src.file_handling.readers import read_csv
+
+
+@pytest.mark.parametrize("delimiter", [None, ";"])
+def test_single_column_skips_whitespace_only_lines(delimiter):
+    content = b"id\n1\n  \n2\n\t\n3\n"
+
+    pyarrow_result = read_csv(content, delimiter=delimiter, backend="pyarrow")
+    pandas_result = read_csv(content, delimiter=delimiter, backend="pandas")
+
+    assert pyarrow_result.success
+    assert pyarrow_result.dataframe["id"].tolist() == ["1", "2", "3"]
+    assert pyarrow_result.dataframe.equals(pandas_result.dataframe)